@@ -16,6 +16,8 @@ if sys.platform == "win32":
         "--clean",
         "--add-data",
         "pyisotools/gui/themes;themes/",
+        "--add-data",
+        "pyisotools/gui/icons.rcc;.",
         "pyisotools/__main__.py",
         "--windowed",
     )
@@ -31,6 +33,8 @@ else:
         "--clean",
         "--add-data",
         "pyisotools/gui/themes:themes/",
+        "--add-data",
+        "pyisotools/gui/icons.rcc:.",
         "pyisotools/__main__.py",
     )
 
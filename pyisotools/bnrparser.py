@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import struct
 from argparse import ArgumentParser
 from functools import wraps
 from io import BytesIO
@@ -256,23 +257,24 @@ class BNR(RGB5A3):
             bytes(name[:0x7F], "shift-jis"))
 
     def get_image(self) -> Image.Image:
-        _image = self.rawImage
-        img = Image.new("RGBA", (BNR.ImageWidth, BNR.ImageHeight))
+        # Unpack every texel up front and detile into one RGBA buffer, a short
+        # banner reads as zero texels just like it did with per-pixel reads
+        _image = self.rawImage.getvalue().ljust(0x1800, b"\x00")
+        pixels = struct.unpack(f">{0x1800 // 2}H", _image)
+        rgba = bytearray(BNR.ImageWidth * BNR.ImageHeight * 4)
 
+        i = 0
         for blockRow in range(BNR.ImgTileHeight):
             for blockColumn in range(BNR.ImgTileWidth):
                 for tileRow in range(BNR.TileHeight):
+                    row = blockRow*BNR.TileHeight + tileRow
                     for tileColumn in range(BNR.TileWidth):
                         column = blockColumn*BNR.TileWidth + tileColumn
-                        row = blockRow*BNR.TileHeight + tileRow
-
-                        pixel = int.from_bytes(
-                            _image.read(2), "big", signed=False)
-                        if column < BNR.ImageWidth and row < BNR.ImageHeight:
-                            img.putpixel(
-                                (column, row), self._decode_pixel(pixel))
+                        ofs = (row*BNR.ImageWidth + column) * 4
+                        rgba[ofs:ofs + 4] = bytes(self._decode_pixel(pixels[i]))
+                        i += 1
 
-        return img
+        return Image.frombytes("RGBA", (BNR.ImageWidth, BNR.ImageHeight), bytes(rgba))
 
     def save_bnr(self, dest: Path):
         dest.write_bytes(self.rawdata.getvalue())
@@ -292,9 +294,10 @@ class BNR(RGB5A3):
         desc: str = "",
         overwrite=False
     ):
-        if f.suffix == ".bnr":
+        suffix = f.suffix.lower()
+        if suffix == ".bnr":
             self.rawdata = BytesIO(f.read_bytes())
-        elif f.suffix in (".png", ".jpeg"):
+        elif suffix in (".png", ".jpeg"):
             self.rawImage = Image.open(f)
 
         self.regionID = region
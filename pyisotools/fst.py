@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import os
 from fnmatch import fnmatch
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterator, Optional, Union
+from stat import S_ISDIR, S_ISREG
+from typing import Iterator, List, Optional, Union
+
+from sortedcontainers import SortedDict
 
 
 class FileAccessOnFolderError(Exception):
@@ -25,6 +30,23 @@ class FSTNode:
     FILE = 0
     FOLDER = 1
 
+    __slots__ = (
+        "_parent",
+        "_children",
+        "_path",
+        "_name",
+        "_sortName",
+        "type",
+        "_alignment",
+        "_position",
+        "_exclude",
+        "_filesize",
+        "_fileoffset",
+        "_dirparent",
+        "_dirnext",
+        "_id",
+    )
+
     def __init__(
         self,
         name: str,
@@ -43,6 +65,11 @@ class FSTNode:
             children: Tuple of children nodes
         """
 
+        self._parent = None
+        # kept in FST order (case insensitive) as children are added
+        self._children = SortedDict(str.upper)
+        self._path = None
+
         self.name = name
         self.type = nodetype
 
@@ -59,8 +86,6 @@ class FSTNode:
         self._dirparent = None
         self._dirnext = None
 
-        self._parent = None
-        self._children = {}
         self._id = nodeid
 
         # setup
@@ -94,71 +119,101 @@ class FSTNode:
 
     @classmethod
     def from_path(cls, path: Path) -> FSTNode:
-        if path.is_file():
-            node = cls.file(path.name, size=path.stat().st_size())
-        elif path.is_dir():
-            node = cls.folder(
-                path.name, children=[cls.from_path(f) for f in path.iterdir()]
-            )
+        try:
+            info = path.stat()
+            mode = info.st_mode
+        except OSError:
+            mode = 0
+
+        if S_ISREG(mode):
+            node = cls.file(path.name, size=info.st_size)
+        elif S_ISDIR(mode):
+            node = cls.folder(path.name, children=cls._children_from_dir(path))
         else:
             raise NotImplementedError(
                 "Initializing a node using anything other than a file or folder is not allowed"
             )
         return node
 
+    @classmethod
+    def _children_from_dir(cls, path: Union[Path, str]) -> List[FSTNode]:
+        """ Build the nodes for a directory from one listing, reusing each DirEntry's cached type and stat """
+        children = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_file():
+                    children.append(cls.file(entry.name, size=entry.stat().st_size))
+                elif entry.is_dir():
+                    children.append(
+                        cls.folder(entry.name, children=cls._children_from_dir(entry.path))
+                    )
+                else:
+                    raise NotImplementedError(
+                        "Initializing a node using anything other than a file or folder is not allowed"
+                    )
+        return children
+
     @classmethod
     def empty(cls):
         return cls("")
 
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        self._name = name
+        self._sortName = name.upper()
+        self._invalidate_path()
+
     @property
     def path(self) -> str:
-        path = self.name
-        parent = self.parent
-        while parent is not None:
-            if parent.is_root():
-                break
-            path = f"{parent.name}/{path}"
-            parent = parent.parent
-        return path
+        if self._path is None:
+            parent = self.parent
+            if parent is None or parent.is_root():
+                self._path = self.name
+            else:
+                self._path = f"{parent.path}/{self.name}"
+        return self._path
 
     @property
     def dirs(self) -> FSTNode:
         for node in self.children:
-            if node.is_dir():
+            if node.type == FSTNode.FOLDER:
                 yield node
 
     @property
     def files(self) -> FSTNode:
         for node in self.children:
-            if node.is_file():
+            if node.type == FSTNode.FILE:
                 yield node
 
     def rdirs(self, includedOnly: bool = False) -> Iterator[FSTNode]:
-        for node in self.children:
-            if includedOnly and node._exclude:
-                continue
-
-            if node.is_dir():
+        for node in self.rchildren(includedOnly):
+            if node.type == FSTNode.FOLDER:
                 yield node
-                yield from node.rdirs(includedOnly=includedOnly)
 
     def rfiles(self, includedOnly: bool = False) -> Iterator[FSTNode]:
-        for node in self.children:
-            if includedOnly and node._exclude:
-                continue
-
-            if node.is_file():
+        for node in self.rchildren(includedOnly):
+            if node.type == FSTNode.FILE:
                 yield node
-            else:
-                yield from node.rfiles(includedOnly=includedOnly)
 
     def rchildren(self, includedOnly: bool = False) -> Iterator[FSTNode]:
-        for node in self.children:
-            if includedOnly and node._exclude:
-                continue
+        # Walk with a stack of child iterators rather than nested generators,
+        # which would pass every node back up through one frame per level
+        stack = [iter(list(self._children.values()))]
+        while stack:
+            for node in stack[-1]:
+                if includedOnly and node._exclude:
+                    continue
 
-            yield node
-            yield from node.rchildren(includedOnly=includedOnly)
+                yield node
+                if node._children:
+                    stack.append(iter(list(node._children.values())))
+                    break
+            else:
+                stack.pop()
 
     @property
     def parent(self) -> FSTNode:
@@ -171,17 +226,23 @@ class FSTNode:
                 self._dirparent = node._id
             else:
                 self._dirparent = 0
-        if self._parent:
-            self._parent.remove_child(self)
+        oldParent = self._parent
+        if oldParent is not None and oldParent is not node:
+            # remove_child() has already dropped the entry, and replacing a
+            # node with one of the same name leaves the key to the new node
+            if oldParent._children.get(self.name) is self:
+                del oldParent._children[self.name]
         if node:
             node._children[self.name] = self
 
         self._parent = node
+        self._invalidate_path()
 
     @property
     def children(self) -> Iterator[FSTNode]:
-        for child in sorted(self._children.values(), key=lambda x: x.name.upper()):
-            yield child
+        # Snapshot so callers can reparent children while iterating, the
+        # dict is already in order so this is a plain copy
+        yield from list(self._children.values())
 
     @property
     def rootnode(self) -> FSTRoot:
@@ -223,18 +284,38 @@ class FSTNode:
         if _path in {"", "."}:
             return self.rootnode
 
-        for node in self.rchildren(skipExcluded):
-            if doGlob:
+        if doGlob:
+            for node in self.rchildren(skipExcluded):
                 if fnmatch(node.path, _path):
                     return node
-            else:
-                if node.path.lower() == _path:
-                    return node
+            return None
+
+        if not self.is_root():
+            prefix = f"{self.path.lower()}/"
+            if not _path.startswith(prefix):
+                return None
+            _path = _path[len(prefix):]
+
+        return self._find_by_parts(_path.split("/"), 0, skipExcluded)
+
+    def _find_by_parts(self, parts: list, depth: int, skipExcluded: bool) -> FSTNode:
+        part = parts[depth]
+        key = part.upper()
+        for name in self._children.irange_key(key, key):
+            node = self._children[name]
+            if name.lower() != part or (skipExcluded and node._exclude):
+                continue
+
+            if depth == len(parts) - 1:
+                return node
+
+            found = node._find_by_parts(parts, depth + 1, skipExcluded)
+            if found is not None:
+                return found
 
         return None
 
     def add_child(self, node: FSTNode):
-        self._children[node.name] = node
         node.parent = self
 
     def remove_child(self, node: FSTNode):
@@ -242,7 +323,13 @@ class FSTNode:
         node.parent = None
 
     def num_children(self, skipExcluded: bool = True) -> int:
-        return len(list(self.rchildren(includedOnly=skipExcluded)))
+        return sum(1 for _ in self.rchildren(includedOnly=skipExcluded))
+
+    def _invalidate_path(self):
+        """ Drop the cached path of this node and everything below it """
+        self._path = None
+        for child in self._children.values():
+            child._invalidate_path()
 
     def destroy(self):
         self.parent = None
@@ -276,10 +363,8 @@ class FSTNode:
 
     def __contains__(self, other: Union[FSTNode, Path]) -> bool:
         if isinstance(other, FSTNode):
-            for child in self.children:
-                if child == other:
-                    return True
-            return False
+            child = self._children.get(other.name)
+            return child is not None and child == other
         return bool(self.find_by_path(other))
 
 
@@ -292,7 +377,7 @@ class FSTRoot(FSTNode):
         return f"{self.__class__.__name__}<{self.num_children()} entries>"
 
     def nodes_by_offset(self, reverse: bool = False) -> FSTNode:
-        for node in sorted(self.rfiles(), key=lambda x: x._fileoffset, reverse=reverse):
+        for node in sorted(self.rfiles(), key=attrgetter("_fileoffset"), reverse=reverse):
             yield node
 
     @staticmethod
@@ -7,15 +7,14 @@ import sys
 import threading
 import traceback
 from enum import Enum, IntEnum
-from fnmatch import fnmatch
 from io import BytesIO
-from pathlib import Path, PurePath
+from pathlib import Path
 from types import TracebackType
 from typing import Callable, Dict, Iterable, Tuple, Union
 
 from PIL import Image, ImageQt
-from PySide6.QtCore import QEvent, Qt, QThread
-from PySide6.QtGui import QIcon, QAction
+from PySide6.QtCore import QEvent, QModelIndex, QPoint, Qt, Slot
+from PySide6.QtGui import QAction, QPixmap, QPixmapCache
 from PySide6.QtWidgets import (
     QDialog,
     QFileDialog,
@@ -30,13 +29,13 @@ from pyisotools import __version__
 from pyisotools.bi2 import BI2
 from pyisotools.bnrparser import BNR
 from pyisotools.iso import FSTNode, GamecubeISO, WiiISO
-from pyisotools.gui.customwidgets import FSTTreeItem
+from pyisotools.gui.customwidgets import FSTTreeModel
 from pyisotools.gui.flagthread import FlagThread
 from pyisotools.gui.mainwindow import Ui_MainWindow
 from pyisotools.gui.nodewindow import NodeFieldAlignmentDialog, NodeFieldPositionDialog
 from pyisotools.gui.updater import GitUpdateScraper
 from pyisotools.gui.updatewindow import Ui_UpdateDialog
-from pyisotools.gui.workpathing import get_program_folder, resource_path
+from pyisotools.gui.workpathing import get_program_folder
 
 
 class ProgramState:
@@ -58,11 +57,11 @@ class ProgramState:
 
     @staticmethod
     def is_error():
-        return ProgramState._GLOBAL_STATE[0] == False
+        return not ProgramState._GLOBAL_STATE[0]
 
     @staticmethod
     def is_success():
-        return ProgramState._GLOBAL_STATE[0] == True
+        return ProgramState._GLOBAL_STATE[0]
 
     @staticmethod
     def reset():
@@ -110,15 +109,16 @@ def notify_status(notification: Union[str, QDialog], context: JobDialogState):
     def decorater_inner(func: Callable):
         @functools.wraps(func)
         def wrapper(*args: Controller, **kwargs):
-            nonlocal notification
+            # Kept per call so a returned message never leaks into the next call
+            message = notification
 
             progressBar = args[0].ui.operationProgressBar
 
             try:
-                if notification is not None:
+                if message is not None:
                     successful = func(*args, **kwargs)
                 else:
-                    successful, notification = func(*args, **kwargs)
+                    successful, message = func(*args, **kwargs)
             except Exception:
                 dialog = JobFailedDialog(args[0], info="".join(traceback.format_exc()))
                 dialog.exec_()
@@ -135,43 +135,43 @@ def notify_status(notification: Union[str, QDialog], context: JobDialogState):
                 progressBar.setValue(0)
                 progressBar.setFormat("Please wait... %p%")
                 ProgramState.reset()
-            elif issubclass(type(notification), QDialog):
+            elif issubclass(type(message), QDialog):
                 if not successful and (context & JobDialogState.SHOW_FAILURE):
-                    notification.exec_()
+                    message.exec_()
                 if successful and (context & JobDialogState.SHOW_COMPLETE):
-                    notification.exec_()
+                    message.exec_()
                 if not successful and (
                     context & JobDialogState.SHOW_FAILURE_WHEN_MESSAGE
                 ):
-                    notification.exec_()
+                    message.exec_()
                 if successful and (context & JobDialogState.SHOW_COMPLETE_WHEN_MESSAGE):
-                    notification.exec_()
+                    message.exec_()
                 if successful and (context & JobDialogState.SHOW_WARNING_WHEN_MESSAGE):
-                    notification.exec_()
+                    message.exec_()
                 if context & JobDialogState.RESET_PROGRESS_AFTER:
                     progressBar.setTextVisible(False)
                     progressBar.setValue(0)
                     progressBar.setFormat("Please wait... %p%")
             else:
                 if not successful and (context & JobDialogState.SHOW_FAILURE):
-                    dialog = JobFailedDialog(args[0], info=notification)
+                    dialog = JobFailedDialog(args[0], info=message)
                     dialog.exec_()
                 if successful and (context & JobDialogState.SHOW_COMPLETE):
-                    dialog = JobCompleteDialog(args[0], info=notification)
+                    dialog = JobCompleteDialog(args[0], info=message)
                     dialog.exec_()
                 if not successful and (
                     context & JobDialogState.SHOW_FAILURE_WHEN_MESSAGE
                 ):
-                    if notification:
-                        dialog = JobFailedDialog(args[0], info=notification)
+                    if message:
+                        dialog = JobFailedDialog(args[0], info=message)
                         dialog.exec_()
                 if successful and (context & JobDialogState.SHOW_COMPLETE_WHEN_MESSAGE):
-                    if notification:
-                        dialog = JobCompleteDialog(args[0], info=notification)
+                    if message:
+                        dialog = JobCompleteDialog(args[0], info=message)
                         dialog.exec_()
                 if successful and (context & JobDialogState.SHOW_WARNING_WHEN_MESSAGE):
-                    if notification:
-                        dialog = JobWarningDialog(notification, args[0])
+                    if message:
+                        dialog = JobWarningDialog(message, args[0])
                         dialog.exec_()
                 if context & JobDialogState.RESET_PROGRESS_AFTER:
                     progressBar.setTextVisible(False)
@@ -252,6 +252,12 @@ class Controller(QMainWindow):
 
     _singleInstance: Controller = None
 
+    # Indexed by `FSTNode.is_dir()`
+    _FILE_SYSTEM_FIELD_LABELS = (
+        ("File Location:", "File Size:"),
+        ("Start Index:", "End Index:"),
+    )
+
     @staticmethod
     def get_instance() -> "Controller":
         return Controller._singleInstance
@@ -291,10 +297,14 @@ class Controller(QMainWindow):
         self.extractPath: Path = None
         self.rootPath: Path = None
         self.genericPath: Path = None
-        self.bnrMap: Dict[PurePath, BNR] = {}
+        self.bnrMap: Dict[str, BNR] = {}
+        self.bnrNodeMap: Dict[str, FSTNode] = {}
 
         self._fromIso = False
         self._viewPath: Path = None
+        self._fileSystemFieldsIsDir: bool = None
+        self._alignmentDialog: NodeFieldAlignmentDialog = None
+        self._positionDialog: NodeFieldPositionDialog = None
 
         self.updater = GitUpdateScraper("JoshuaMKW", "pyisotools")
         self.updater.updateFound.connect(self.notify_update)
@@ -332,18 +342,12 @@ class Controller(QMainWindow):
 
     def is_dolphin_root(self) -> bool:
         if not self.is_from_iso():
-            folders = {x.name.lower() for x in self.rootPath.iterdir() if x.is_dir()}
-            return (
-                "sys" in folders
-                and "files" in folders
-                and "&&systemdata" not in folders
-            )
+            return self.iso.is_dolphin_root()
         return False
 
     def is_gcr_root(self) -> bool:
         if not self.is_from_iso():
-            folders = {x.name.lower() for x in self.rootPath.iterdir() if x.is_dir()}
-            return "&&systemdata" in folders
+            return self.iso.is_gcr_root()
         return False
 
     def get_minimum_free_address(self) -> int:
@@ -375,6 +379,22 @@ class Controller(QMainWindow):
             baseSize = (baseSize + 3) & -4
         return baseSize
 
+    def changeEvent(self, event):
+        if event.type() == QEvent.LanguageChange:
+            # retranslateUi also resets the window title, keep the loaded game's
+            title = self.windowTitle()
+            self.ui.clearTranslations()
+            self.ui.retranslateUi(self)
+            self.setWindowTitle(title)
+            # retranslateUi resets the field labels to the file ones, so
+            # reapply whichever set the current selection last used
+            isDir = self._fileSystemFieldsIsDir
+            self._fileSystemFieldsIsDir = None
+            if isDir is not None:
+                self._set_file_system_labels(isDir)
+            self.bnr_update_info()
+        super().changeEvent(event)
+
     def closeEvent(self, event):
         self.update_program_config()
         self.updater.exit(0)
@@ -383,8 +403,10 @@ class Controller(QMainWindow):
             thread.wait()
         event.accept()
 
+    @Slot()
     def notify_update(self):
-        newestRelease = self.updater.get_newest_release()
+        releases = self.updater.manager
+        newestRelease = releases.get_newest_release()
 
         dialog = QDialog(
             self,
@@ -398,13 +420,13 @@ class Controller(QMainWindow):
             f"pyisotools {newestRelease.tag_name} available!"
         )
         updateWindow.changelogTextEdit.setMarkdown(
-            self.updater.compile_changelog_from(__version__)
+            releases.compile_changelog_from(__version__)
         )
 
         self.updater.blockSignals(True)
 
         if dialog.exec_() == QDialog.Accepted:
-            self.updater.view(newestRelease)
+            releases.view(newestRelease)
 
         self.updater.blockSignals(False)
 
@@ -415,6 +437,7 @@ class Controller(QMainWindow):
     # -- // CONNECTED SIGNALS // -- #
     # ----------------------------- #
 
+    @Slot()
     @notify_status(
         None,
         JobDialogState.SHOW_FAILURE_WHEN_MESSAGE | JobDialogState.RESET_PROGRESS_AFTER,
@@ -467,6 +490,7 @@ class Controller(QMainWindow):
 
         return True, ""
 
+    @Slot()
     @notify_status(
         None,
         JobDialogState.SHOW_FAILURE_WHEN_MESSAGE | JobDialogState.RESET_PROGRESS_AFTER,
@@ -525,6 +549,7 @@ class Controller(QMainWindow):
 
         return True, ""
 
+    @Slot()
     @notify_status(
         "",
         JobDialogState.SHOW_FAILURE_WHEN_MESSAGE
@@ -552,6 +577,7 @@ class Controller(QMainWindow):
 
         return True
 
+    @Slot()
     @notify_status(
         "",
         JobDialogState.SHOW_FAILURE_WHEN_MESSAGE
@@ -579,6 +605,7 @@ class Controller(QMainWindow):
 
         return True
 
+    @Slot()
     @notify_status(
         "",
         JobDialogState.SHOW_FAILURE_WHEN_MESSAGE
@@ -602,6 +629,7 @@ class Controller(QMainWindow):
 
         return True
 
+    @Slot()
     @notify_status(
         "The file does not exist!",
         JobDialogState.SHOW_FAILURE_WHEN_MESSAGE | JobDialogState.RESET_PROGRESS_AFTER,
@@ -647,12 +675,14 @@ class Controller(QMainWindow):
 
         self.bnrImagePath = Path(dialog.selectedFiles()[0]).resolve()
 
-        currentBNR = self.bnrMap[PurePath(self.ui.bannerComboBox.currentText())]
+        bnrName = self.ui.bannerComboBox.currentText()
+        currentBNR = self.bnrMap[bnrName]
         if self.bnrImagePath.is_file():
-            if self.bnrImagePath.suffix == ".bnr":
-                currentBNR.rawImage = BytesIO(
-                    self.bnrImagePath.read_bytes()[0x20:0x1820]
-                )
+            if self.bnrImagePath.suffix.lower() == ".bnr":
+                with self.bnrImagePath.open("rb") as bnrFile:
+                    bnrFile.seek(0x20)
+                    currentBNR.rawImage = BytesIO(bnrFile.read(0x1800))
+                QPixmapCache.remove(self._bnr_pixmap_key(bnrName))
                 self.bnr_update_info()
             else:
                 with Image.open(self.bnrImagePath) as image:
@@ -663,18 +693,16 @@ class Controller(QMainWindow):
                         )
                         dialog.exec_()
                     currentBNR.rawImage = image
-                pixmap = ImageQt.toqpixmap(currentBNR.get_image())
-                pixmap = pixmap.scaled(
-                    self.ui.bannerImageView.geometry().width() - 1,
-                    self.ui.bannerImageView.geometry().height() - 1,
-                    Qt.KeepAspectRatio,
+                QPixmapCache.remove(self._bnr_pixmap_key(bnrName))
+                self.ui.bannerImageView.setPixmap(
+                    self._bnr_pixmap(bnrName, currentBNR)
                 )
-                self.ui.bannerImageView.setPixmap(pixmap)
 
             return True, ""
         else:
             return False, "The file does not exist!"
 
+    @Slot()
     @notify_status(
         "",
         JobDialogState.SHOW_FAILURE_WHEN_MESSAGE | JobDialogState.RESET_PROGRESS_AFTER,
@@ -697,7 +725,7 @@ class Controller(QMainWindow):
 
         self.bnrImagePath = Path(dialog.selectedFiles()[0]).resolve()
 
-        currentBNR = self.bnrMap[PurePath(self.ui.bannerComboBox.currentText())]
+        currentBNR = self.bnrMap[self.ui.bannerComboBox.currentText()]
         image = currentBNR.get_image()
         image.save(self.bnrImagePath)
 
@@ -716,29 +744,55 @@ class Controller(QMainWindow):
         self.ui.bannerImageView.clear()
         self.ui.bannerImageView.setFrameShape(QFrame.Shape.Box)
 
+        for bnrName in self.bnrMap:
+            QPixmapCache.remove(self._bnr_pixmap_key(bnrName))
         self.bnrMap.clear()
+        self.bnrNodeMap.clear()
 
         if self._fromIso:
             with self.iso.isoPath.open("rb") as f:
                 for node in self.iso.rchildren():
-                    if node.is_file() and node.name.endswith(".bnr"):
+                    if node.is_file() and node.name.lower().endswith(".bnr"):
                         f.seek(node._fileoffset)
-                        self.bnrMap[PurePath(node.path)] = BNR.from_data(
-                            f, size=node.size
-                        )
+                        self.bnrMap[node.path] = BNR.from_data(f, size=node.size)
+                        self.bnrNodeMap[node.path] = node
         else:
-            for p in self.rootPath.rglob("*.bnr"):
-                if p.is_file():
-                    with p.open("rb") as pp:
-                        self.bnrMap[p.relative_to(self.rootPath / "files")] = (
-                            BNR.from_data(pp, size=p.stat().st_size)
-                        )
+            # The FST loaded from the root already lists every file, so
+            # there is no need to walk the folder again
+            dataPath = self.iso.dataPath
+            for node in self.iso.rfiles():
+                if node.name.lower().endswith(".bnr"):
+                    with (dataPath / node.path).open("rb") as f:
+                        self.bnrMap[node.path] = BNR.from_data(f, size=node.size)
+                    self.bnrNodeMap[node.path] = node
 
         self.ui.bannerComboBox.clear()
         self.ui.bannerComboBox.addItems(
-            sorted(["/".join(p.parts) for p in self.bnrMap.keys()], key=str.lower)
+            sorted(self.bnrMap.keys(), key=str.lower)
         )
 
+    def _bnr_pixmap_key(self, bnrName: str) -> str:
+        geometry = self.ui.bannerImageView.geometry()
+        return f"bnr:{bnrName}@{geometry.width() - 1}x{geometry.height() - 1}"
+
+    def _bnr_pixmap(self, bnrName: str, bnr: BNR) -> QPixmap:
+        """
+        Return the banner image scaled to the image view, decoding it only
+        when it isn't already in the pixmap cache
+        """
+        key = self._bnr_pixmap_key(bnrName)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            geometry = self.ui.bannerImageView.geometry()
+            pixmap = ImageQt.toqpixmap(bnr.get_image()).scaled(
+                geometry.width() - 1,
+                geometry.height() - 1,
+                Qt.KeepAspectRatio,
+            )
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    @Slot(str)
     def bnr_update_info(self, *args):
         if len(self.bnrMap) == 0:
             return
@@ -753,20 +807,16 @@ class Controller(QMainWindow):
 
         bnrLangComboBox.setItemText(0, "English")
 
-        curBnrName = Path(bnrComboBox.currentText())
+        curBnrName = bnrComboBox.currentText()
         if not curBnrName in self.bnrMap:
-            curBnrName = list(self.bnrMap.keys())[0]
-            bnrComboBox.setCurrentText(curBnrName.as_posix())
+            curBnrName = next(iter(self.bnrMap))
+            bnrComboBox.setCurrentText(curBnrName)
 
         bnr = self.bnrMap[curBnrName]
 
-        pixmap = ImageQt.toqpixmap(bnr.get_image())
-        pixmap = pixmap.scaled(
-            self.ui.bannerImageView.geometry().width() - 1,
-            self.ui.bannerImageView.geometry().height() - 1,
-            Qt.KeepAspectRatio,
+        self.ui.bannerImageView.setPixmap(
+            self._bnr_pixmap(curBnrName, bnr)
         )
-        self.ui.bannerImageView.setPixmap(pixmap)
         self.ui.bannerImageView.setFrameShape(QFrame.NoFrame)
 
         self.ui.bannerVersionTextBox.setPlainText(bnr.magic)
@@ -794,6 +844,7 @@ class Controller(QMainWindow):
         bnrComboBox.blockSignals(False)
         bnrLangComboBox.blockSignals(False)
 
+    @Slot()
     @notify_status(
         None,
         JobDialogState.SHOW_FAILURE_WHEN_MESSAGE
@@ -811,7 +862,7 @@ class Controller(QMainWindow):
         if len(self.bnrMap) == 0:
             return
 
-        bnr = self.bnrMap[PurePath(self.ui.bannerComboBox.currentText())]
+        bnr = self.bnrMap[self.ui.bannerComboBox.currentText()]
 
         bnr.index = self.ui.bannerLanguageComboBox.currentIndex()
         bnr.gameName = self.ui.bannerShortNameTextBox.toPlainText()
@@ -820,13 +871,8 @@ class Controller(QMainWindow):
         bnr.developerTitle = self.ui.bannerLongMakerTextBox.toPlainText()
         bnr.gameDescription = self.ui.bannerDescTextBox.toPlainText()
 
+        bnrNode = self.bnrNodeMap.get(self.ui.bannerComboBox.currentText())
         if self._fromIso:
-            bnrNode = None
-            for child in self.iso.rchildren():
-                if child.path == self.ui.bannerComboBox.currentText():
-                    bnrNode = child
-                    break
-
             if bnrNode is None:
                 raise RuntimeError("Node not found for BNR save")
 
@@ -837,23 +883,22 @@ class Controller(QMainWindow):
                 f.seek(bnrNode._fileoffset, 0)
                 f.write(bnr.rawdata.getvalue())
         else:
-            # Recurse through the root path and find the BNR that matches the current selection
-            bnrPath = None
-            for p in self.rootPath.rglob("*.bnr"):
-                if p.is_file() and p.relative_to(self.rootPath / "files") == PurePath(
-                    self.ui.bannerComboBox.currentText()
-                ):
-                    bnrPath = p
-                    break
-
-            if bnrPath is None or not bnrPath.is_file():
+            if bnrNode is None:
                 raise RuntimeError("Not a file for BNR save")
 
-            if bnrPath.name == "opening.bnr":
-                self.iso.bnr = bnr
+            # Opening in place fails the same way a missing file did, without
+            # stat()ing the path first
+            try:
+                with (self.iso.dataPath / bnrNode.path).open("r+b") as f:
+                    f.write(bnr.rawdata.getvalue())
+                    f.truncate()
+            except (FileNotFoundError, IsADirectoryError) as e:
+                raise RuntimeError("Not a file for BNR save") from e
 
-            bnrPath.write_bytes(bnr.rawdata.getvalue())
+            if bnrNode.name == "opening.bnr":
+                self.iso.bnr = bnr
 
+    @Slot()
     def help_about(self):
         desc = "".join(
             [
@@ -873,6 +918,7 @@ class Controller(QMainWindow):
 
         QMessageBox.about(self, "About pyisotools", desc)
 
+    @Slot()
     def help_file_alignment(self):
         info = "".join(
             [
@@ -902,6 +948,7 @@ class Controller(QMainWindow):
         dialog.setWindowTitle("File Alignment")
         dialog.exec_()
 
+    @Slot()
     def help_file_position(self):
         info = "".join(
             [
@@ -929,6 +976,7 @@ class Controller(QMainWindow):
         dialog.setWindowTitle("File Position")
         dialog.exec_()
 
+    @Slot()
     def help_file_exclusion(self):
         info = "".join(
             [
@@ -970,6 +1018,7 @@ class Controller(QMainWindow):
         else:
             self.theme = Controller.Themes.LIGHT
 
+    @Slot(bool)
     def update_dark(self, isDark: bool):
         if isDark:
             theme = Controller.Themes.DARK
@@ -1058,6 +1107,7 @@ class Controller(QMainWindow):
         self.ui.isoRegionComboBox.setEnabled(False)
         self.ui.isoDiskIDTextBox.setPlainText(f"0x{self.iso.bootheader.diskID:02X}")
 
+    @Slot()
     @notify_status(
         None,
         JobDialogState.SHOW_FAILURE_WHEN_MESSAGE
@@ -1101,66 +1151,65 @@ class Controller(QMainWindow):
         else:
             self.iso.save_system_data()
 
+    @Slot()
     def reset_all(self):
         self.ui.setupUi(self)
+        self._fileSystemFieldsIsDir = None
         self.update_theme(self.theme)
         self.setWindowTitle(self.get_window_title())
 
     def load_file_system(self):
-        rootNode = FSTTreeItem()
-        rootNode.setIcon(0, QIcon(":/icons/Disc"))
-        rootNode.setText(0, "root")
-        rootNode.node = self.iso
-        self._load_fst_tree(rootNode, self.iso)
-
-        self.ui.fileSystemTreeWidget.takeTopLevelItem(0)
-        self.ui.fileSystemTreeWidget.addTopLevelItem(rootNode)
-
-        self.ui.fileSystemTreeWidget.sortItems(0, Qt.SortOrder.AscendingOrder)
+        treeView = self.ui.fileSystemTreeView
+        model = treeView.model()
+        if model is None:
+            model = FSTTreeModel(treeView)
+            treeView.setModel(model)
+        model.set_root(self.iso)
 
     # pylint: disable=no-member
+    @Slot(QPoint)
     def file_system_context_menu(self, point):
         # Infos about the node selected.
-        index = self.ui.fileSystemTreeWidget.indexAt(point)
+        index = self.ui.fileSystemTreeView.indexAt(point)
 
         if not index.isValid():
             return
 
-        item = self.ui.fileSystemTreeWidget.itemAt(point)
-        self.file_system_set_fields(item, 0)
+        node = self.ui.fileSystemTreeView.model().node(index)
+        self.file_system_set_fields(index)
 
         # We build the menu.
-        menu = QMenu(self.ui.fileSystemTreeWidget)
+        menu = QMenu(self.ui.fileSystemTreeView)
 
         if not self.is_from_iso():
-            if item.node.is_root():
+            if node.is_root():
                 path = self.iso.root
             else:
-                path = self.iso.dataPath / item.node.path
+                path = self.iso.dataPath / node.path
 
-            buildAction = QAction(f"Build Root To...", self.ui.fileSystemTreeWidget)
+            buildAction = QAction(f"Build Root To...", self.ui.fileSystemTreeView)
             buildAction.triggered.connect(self.iso_build_dialog)
-            viewAction = QAction("Open Path in Explorer", self.ui.fileSystemTreeWidget)
+            viewAction = QAction("Open Path in Explorer", self.ui.fileSystemTreeView)
             viewAction.triggered.connect(
                 lambda clicked=None, x=path: self.open_path_in_explorer(x)
             )
-            alignmentAction = QAction("Set Alignment...", self.ui.fileSystemTreeWidget)
+            alignmentAction = QAction("Set Alignment...", self.ui.fileSystemTreeView)
             alignmentAction.triggered.connect(
-                lambda clicked=None, x=item: self._open_alignment_dialog(x)
+                lambda clicked=None, x=index: self._open_alignment_dialog(x)
             )
-            positionAction = QAction("Set Position...", self.ui.fileSystemTreeWidget)
+            positionAction = QAction("Set Position...", self.ui.fileSystemTreeView)
             positionAction.triggered.connect(
-                lambda clicked=None, x=item: self._open_position_dialog(x)
+                lambda clicked=None, x=index: self._open_position_dialog(x)
             )
             excludeAction = QAction(
-                "Include" if item.node._exclude else "Exclude",
-                self.ui.fileSystemTreeWidget,
+                "Include" if node._exclude else "Exclude",
+                self.ui.fileSystemTreeView,
             )
             excludeAction.triggered.connect(
-                lambda clicked=None, x=item: self._disable_node(x)
+                lambda clicked=None, x=index: self._disable_node(x)
             )
 
-            if item.node.is_root():
+            if node.is_root():
                 menu.addAction(buildAction)
                 menu.addSeparator()
 
@@ -1168,26 +1217,26 @@ class Controller(QMainWindow):
             menu.addSeparator()
             menu.addAction(alignmentAction)
 
-            if item.node.is_file():
+            if node.is_file():
                 menu.addAction(positionAction)
 
-            if not item.node.is_root():
+            if not node.is_root():
                 menu.addSeparator()
                 menu.addAction(excludeAction)
         else:
-            if item.node.is_root():
+            if node.is_root():
                 extractAction = QAction(
-                    f"Extract ISO To...", self.ui.fileSystemTreeWidget
+                    f"Extract ISO To...", self.ui.fileSystemTreeView
                 )
                 extractAction.triggered.connect(self.iso_extract_dialog)
                 extractWithPosAction = QAction(
-                    f"Extract ISO With Positions To...", self.ui.fileSystemTreeWidget
+                    f"Extract ISO With Positions To...", self.ui.fileSystemTreeView
                 )
                 extractWithPosAction.triggered.connect(
                     lambda x: self.iso_extract_dialog(True)
                 )
                 sysExtractAction = QAction(
-                    f"Extract System Data To...", self.ui.fileSystemTreeWidget
+                    f"Extract System Data To...", self.ui.fileSystemTreeView
                 )
                 sysExtractAction.triggered.connect(self.iso_extract_system_dialog)
                 menu.addAction(extractAction)
@@ -1195,34 +1244,41 @@ class Controller(QMainWindow):
                 menu.addAction(sysExtractAction)
             else:
                 extractAction = QAction(
-                    f'Extract "{item.text(0)}" To...', self.ui.fileSystemTreeWidget
+                    f'Extract "{index.data()}" To...', self.ui.fileSystemTreeView
                 )
                 extractAction.triggered.connect(
-                    lambda x=self, y=item.node: self.save_generic_to_folder(
+                    lambda x=self, y=node: self.save_generic_to_folder(
                         parent=x, callback=_extract_path_from_iso, args=(y,)
                     )
                 )
                 menu.addAction(extractAction)
 
-        menu.exec_(self.ui.fileSystemTreeWidget.mapToGlobal(point))
+        menu.exec_(self.ui.fileSystemTreeView.mapToGlobal(point))
 
     # pylint: enable=no-member
 
-    def file_system_set_fields(self, item: FSTTreeItem, column: int):
-        if item.node.is_dir():
-            self.ui.fileSystemStartInfoLabel.setText("Start Index:")
-            self.ui.fileSystemSizeInfoLabel.setText("End Index:")
-            self.ui.fileSystemStartInfoTextBox.setPlainText(str(item.node._id))
-            self.ui.fileSystemSizeInfoTextBox.setPlainText(
-                str(item.node.size + item.node._id)
-            )
+    def _set_file_system_labels(self, isDir: bool):
+        if isDir != self._fileSystemFieldsIsDir:
+            startLabel, sizeLabel = Controller._FILE_SYSTEM_FIELD_LABELS[isDir]
+            self.ui.fileSystemStartInfoLabel.setText(startLabel)
+            self.ui.fileSystemSizeInfoLabel.setText(sizeLabel)
+            self._fileSystemFieldsIsDir = isDir
+
+    @Slot(QModelIndex)
+    def file_system_set_fields(self, index: QModelIndex):
+        node = self.ui.fileSystemTreeView.model().node(index)
+        isDir = node.is_dir()
+
+        self._set_file_system_labels(isDir)
+
+        if isDir:
+            self.ui.fileSystemStartInfoTextBox.setPlainText(str(node._id))
+            self.ui.fileSystemSizeInfoTextBox.setPlainText(str(node.size + node._id))
         else:
-            self.ui.fileSystemStartInfoLabel.setText("File Location:")
-            self.ui.fileSystemSizeInfoLabel.setText("File Size:")
             self.ui.fileSystemStartInfoTextBox.setPlainText(
-                f"0x{item.node._fileoffset if not item.node._position else item.node._position:X}"
+                f"0x{node._fileoffset if not node._position else node._position:X}"
             )
-            self.ui.fileSystemSizeInfoTextBox.setPlainText(f"0x{item.node.size:X}")
+            self.ui.fileSystemSizeInfoTextBox.setPlainText(f"0x{node.size:X}")
 
     @notify_status(
         "",
@@ -1264,21 +1320,24 @@ class Controller(QMainWindow):
             return True
 
     @notify_status(None, JobDialogState.SHOW_FAILURE_WHEN_MESSAGE)
-    def _open_alignment_dialog(self, item: FSTTreeItem):
-        dialog = NodeFieldAlignmentDialog(
-            self,
-            Qt.WindowSystemMenuHint | Qt.WindowTitleHint | Qt.WindowCloseButtonHint,
-        )
+    def _open_alignment_dialog(self, index: QModelIndex):
+        node = self.ui.fileSystemTreeView.model().node(index)
 
-        dialog.setWindowTitle(item.text(0))
-        dialog.setModal(True)
+        if self._alignmentDialog is None:
+            self._alignmentDialog = NodeFieldAlignmentDialog(
+                self,
+                Qt.WindowSystemMenuHint | Qt.WindowTitleHint | Qt.WindowCloseButtonHint,
+            )
 
-        if item.node._alignment:
+        dialog = self._alignmentDialog
+        dialog.setWindowTitle(index.data())
+
+        if node._alignment:
             dialog.alignmentComboBox.setCurrentIndex(
-                dialog.alignmentComboBox.findText(str(item.node._alignment))
+                dialog.alignmentComboBox.findText(str(node._alignment))
             )
-            # dialog.lineEdit.setText(str(item.node._alignment))
-            # dialog.plainTextEdit.setPlainText(str(item.node._alignment))
+            # dialog.lineEdit.setText(str(node._alignment))
+            # dialog.plainTextEdit.setPlainText(str(node._alignment))
         else:
             dialog.alignmentComboBox.setCurrentIndex(0)
 
@@ -1289,33 +1348,40 @@ class Controller(QMainWindow):
         text = dialog.alignmentComboBox.currentText()
         alignment = int(text, 0)
 
-        if item.node.is_file() and item.node._alignment != alignment:
-            item.node._alignment = alignment
+        if node.is_file() and node._alignment != alignment:
+            node._alignment = alignment
             self.iso.pre_calc_metadata(self.iso.MaxSize - self.iso.get_auto_blob_size())
             self.ui.fileSystemStartInfoTextBox.setPlainText(
-                f"0x{item.node._fileoffset:X}"
+                f"0x{node._fileoffset:X}"
             )
-        if item.node.is_dir():
-            for child in item.node.rchildren():
+        if node.is_dir():
+            for child in node.rchildren():
                 child._alignment = _round_up_to_power_of_2(alignment)
             self.iso.pre_calc_metadata(self.iso.MaxSize - self.iso.get_auto_blob_size())
 
         return True, ""
 
     @notify_status(None, JobDialogState.SHOW_FAILURE_WHEN_MESSAGE)
-    def _open_position_dialog(self, item: FSTTreeItem):
-        dialog = NodeFieldPositionDialog(
-            self.get_minimum_free_address(),
-            GamecubeISO.MaxSize - ((item.node.datasize + 3) & -4),
-            self,
-            Qt.WindowSystemMenuHint | Qt.WindowTitleHint | Qt.WindowCloseButtonHint,
-        )
+    def _open_position_dialog(self, index: QModelIndex):
+        node = self.ui.fileSystemTreeView.model().node(index)
+
+        minimum = self.get_minimum_free_address()
+        maximum = GamecubeISO.MaxSize - ((node.datasize + 3) & -4)
+        if self._positionDialog is None:
+            self._positionDialog = NodeFieldPositionDialog(
+                minimum,
+                maximum,
+                self,
+                Qt.WindowSystemMenuHint | Qt.WindowTitleHint | Qt.WindowCloseButtonHint,
+            )
+        else:
+            self._positionDialog.set_range(minimum, maximum)
 
-        dialog.setWindowTitle(item.text(0))
-        dialog.setModal(True)
+        dialog = self._positionDialog
+        dialog.setWindowTitle(index.data())
 
-        if item.node._position:
-            dialog.lineEdit.setText(f"{item.node._position:X}")
+        if node._position:
+            dialog.lineEdit.setText(f"{node._position:X}")
         else:
             dialog.lineEdit.setText("")
 
@@ -1327,32 +1393,33 @@ class Controller(QMainWindow):
         position = -1 if text.strip() == "" else int(text, 16)
 
         if position < 0:
-            if item.node._position:
-                item.node._position = None
+            if node._position:
+                node._position = None
                 self.iso.pre_calc_metadata(
                     self.iso.MaxSize - self.iso.get_auto_blob_size()
                 )
                 self.ui.fileSystemStartInfoTextBox.setPlainText(
-                    f"0x{item.node._fileoffset:X}"
+                    f"0x{node._fileoffset:X}"
                 )
             return True, ""
         else:
             newPos = min(position, self.iso.MaxSize - 4) & -4
-            if item.node._position != newPos:
-                item.node._position = newPos
+            if node._position != newPos:
+                node._position = newPos
                 self.iso.pre_calc_metadata(
                     self.iso.MaxSize - self.iso.get_auto_blob_size()
                 )
 
             self.ui.fileSystemStartInfoTextBox.setPlainText(
-                f"0x{item.node._position:X}"
+                f"0x{node._position:X}"
             )
             return True, ""
 
-    def _disable_node(self, item: FSTTreeItem):
-        node = item.node
+    def _disable_node(self, index: QModelIndex):
+        model = self.ui.fileSystemTreeView.model()
+        node = model.node(index)
         isRootFile = node.parent.is_root() and node.is_file()
-        isAnyBNR = fnmatch(node.name, "*.bnr")
+        isAnyBNR = node.name.lower().endswith(".bnr")
         if node._exclude:
             node._exclude = False
             if isRootFile and isAnyBNR:
@@ -1365,36 +1432,21 @@ class Controller(QMainWindow):
 
                 if node.name == "opening.bnr":
                     self.iso.bnr = BNR(
-                        self.iso.dataPath / item.node.path, region=region
+                        self.iso.dataPath / node.path, region=region
                     )
 
                 self.bnr_reset_info()
                 self.bnr_update_info()
         else:
-            item.node._exclude = True
+            node._exclude = True
             if isRootFile and isAnyBNR:
                 if node.name == "opening.bnr":
                     self.iso.bnr = None
                 self.bnr_reset_info()
 
-        item.setDisabled(item.node._exclude)
+        model.node_changed(index)
         self.iso.pre_calc_metadata(self.iso.MaxSize - self.iso.get_auto_blob_size())
-        self.ui.fileSystemStartInfoTextBox.setPlainText(f"0x{item.node._fileoffset:X}")
-
-    def _load_fst_tree(self, parent: FSTTreeItem, node: FSTNode):
-        for child in node.children:
-            treeNode = FSTTreeItem(child.name)
-            treeNode.setText(0, child.name)
-            treeNode.setDisabled(child._exclude)
-            treeNode.node = child
-
-            if child.is_dir():
-                treeNode.setIcon(0, QIcon(":/icons/Folder"))
-                self._load_fst_tree(treeNode, child)
-            else:
-                treeNode.setIcon(0, QIcon(":/icons/File"))
-
-            parent.addChild(treeNode)
+        self.ui.fileSystemStartInfoTextBox.setPlainText(f"0x{node._fileoffset:X}")
 
     @staticmethod
     def _iso_job_start_callback(jobName: str, jobSize: int) -> None:
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from enum import IntEnum
+from typing import Dict, List, Optional
 
-from PySide6.QtCore import Qt, QRegularExpression, Signal
-from PySide6.QtGui import (QKeyEvent, QKeySequence, QIntValidator,
-                           QTextOption)
-from PySide6.QtWidgets import QApplication, QPlainTextEdit, QTreeWidgetItem, QLineEdit
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QObject, QPoint, Qt, Signal, Slot
+from PySide6.QtGui import QIcon, QKeyEvent, QKeySequence, QTextOption
+from PySide6.QtWidgets import QApplication, QPlainTextEdit, QLineEdit
 
 from pyisotools.fst import FSTNode
 
@@ -102,6 +102,7 @@ class FilteredPlainTextEdit(QPlainTextEdit):
             hbar.setValue(hbar.minimum())
         return state
 
+    @Slot(QPoint)
     def context_menu(self, point):
         menu = self.createStandardContextMenu(self.mapToGlobal(point))
         menu.actions()[5].triggered.disconnect()
@@ -127,52 +128,171 @@ class FilteredPlainTextEdit(QPlainTextEdit):
         self.setTextCursor(textCursor)
 
 
-class FSTTreeItem(QTreeWidgetItem):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._fstNode = None
-
-    @ property
-    def node(self) -> FSTNode:
-        return self._fstNode
-
-    @ node.setter
-    def node(self, node: FSTNode):
-        self._fstNode = node
-
-    @ property
-    def alignment(self) -> int:
-        return self.node._alignment
-
-    @ alignment.setter
-    def alignment(self, align: int):
-        self.node._alignment = align
-
-    @ property
-    def position(self) -> int:
-        return self.node._fileoffset
-
-    @ position.setter
-    def position(self, pos: int):
-        self.node._fileoffset = pos
-
-    @ property
-    def excluded(self) -> int:
-        return self.node._exclude
-
-    @ excluded.setter
-    def excluded(self, exclude: bool):
-        self.node._exclude = exclude
-
-    def __lt__(self, other: FSTTreeItem):
-        """ Used for tree sorting """
-        if self.node.is_root() and not other.node.is_root():
-            return True
-        if self.node.is_dir() and other.node.is_file():
-            return True
-        if self.node.is_file() and other.node.is_dir():
+def _row_sort_key(node: FSTNode) -> tuple:
+    # Directories first, then FST order; the name breaks ties in
+    # trees that have not been assigned ids yet
+    return (node.type == FSTNode.FILE, node._id, node._sortName)
+
+
+class FSTTreeModel(QAbstractItemModel):
+    """
+    Item model exposing an FST to a QTreeView
+
+    Rows reference the FSTNodes directly, so no per-node item objects are
+    created. Children are listed directories first, then in FST order, and
+    are only sorted into rows once their directory is first expanded
+    """
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._root: FSTNode = None
+        self._rows: Dict[int, List[FSTNode]] = {}
+        self._rowOf: Dict[int, int] = {}
+        self._flags: Dict[int, Qt.ItemFlags] = {}
+
+        self._discIcon = QIcon(":/icons/Disc")
+        # Indexed by `FSTNode.type`
+        self._nodeIcons = (QIcon(":/icons/File"), QIcon(":/icons/Folder"))
+
+    def root(self) -> FSTNode:
+        return self._root
+
+    def set_root(self, root: FSTNode):
+        self.beginResetModel()
+        self._root = root
+        self._rows.clear()
+        self._rowOf.clear()
+        self._flags.clear()
+        self.endResetModel()
+
+    def node(self, index: QModelIndex) -> FSTNode:
+        if not index.isValid():
+            return None
+        return index.internalPointer()
+
+    def node_changed(self, index: QModelIndex):
+        """ Notify the views that `index` and everything below it has changed """
+        self._flags.clear()
+        self.dataChanged.emit(index, index)
+
+        node = self.node(index)
+        if node is not None and node.type == FSTNode.FOLDER:
+            self._rows_changed(index, node)
+
+    def _rows_changed(self, index: QModelIndex, node: FSTNode):
+        # One signal per fetched directory; the range already covers the
+        # subdirectories themselves, so only their rows are visited below
+        rows = self._rows.get(id(node))
+        if not rows:
+            return
+
+        self.dataChanged.emit(
+            self.index(0, 0, index), self.index(len(rows) - 1, 0, index)
+        )
+        for row, child in enumerate(rows):
+            if child.type == FSTNode.FOLDER:
+                self._rows_changed(self.index(row, 0, index), child)
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+
+        if not parent.isValid():
+            return self.createIndex(row, column, self._root)
+
+        return self.createIndex(row, column, self._rows[id(parent.internalPointer())][row])
+
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+
+        node: FSTNode = index.internalPointer()
+        if node is self._root:
+            return QModelIndex()
+
+        parent = node.parent
+        if parent is self._root:
+            return self.createIndex(0, 0, parent)
+
+        return self.createIndex(self._rowOf[id(parent)], 0, parent)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+
+        if not parent.isValid():
+            return 0 if self._root is None else 1
+
+        rows = self._rows.get(id(parent.internalPointer()))
+        if rows is None:
+            return 0
+
+        return len(rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if not parent.isValid():
+            return self._root is not None
+
+        node: FSTNode = parent.internalPointer()
+        return node.type == FSTNode.FOLDER and len(node._children) > 0
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if not parent.isValid():
             return False
-        return self.node._id < other.node._id
+
+        node: FSTNode = parent.internalPointer()
+        return node.type == FSTNode.FOLDER and id(node) not in self._rows
+
+    def fetchMore(self, parent: QModelIndex):
+        if not self.canFetchMore(parent):
+            return
+
+        node: FSTNode = parent.internalPointer()
+        rows = sorted(node._children.values(), key=_row_sort_key)
+        if len(rows) == 0:
+            self._rows[id(node)] = rows
+            return
+
+        self.beginInsertRows(parent, 0, len(rows) - 1)
+        self._rows[id(node)] = rows
+        self._rowOf.update((id(child), row) for row, child in enumerate(rows))
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        node: FSTNode = index.internalPointer()
+        if role == Qt.DisplayRole:
+            return "root" if node is self._root else node.name
+        if role == Qt.DecorationRole:
+            if node is self._root:
+                return self._discIcon
+            return self._nodeIcons[node.type]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+
+        return self._node_flags(index.internalPointer())
+
+    def _node_flags(self, node: FSTNode) -> Qt.ItemFlags:
+        # Excluding a folder excludes everything under it, so a node's flags
+        # follow its parent's unless it is excluded itself
+        flags = self._flags.get(id(node))
+        if flags is None:
+            if node._exclude:
+                flags = Qt.ItemIsSelectable
+            elif node.parent is None:
+                flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+            else:
+                flags = self._node_flags(node.parent)
+            self._flags[id(node)] = flags
+        return flags
 
 # pylint: enable=invalid-name
 # pylint: enable=no-member
@@ -1,3 +1,4 @@
+import threading
 from typing import Any, Callable, Tuple
 
 from PySide6.QtCore import QThread
@@ -10,30 +11,34 @@ class FlagThread(QThread):
         super().__init__(*_args, **_kwargs)
         self._target = target
         self._args = args
-        self._isQuit = False
+        self._quitEvent = threading.Event()
 
     def isQuitting(self):
-        return self._isQuit
+        return self._quitEvent.is_set()
+
+    def waitForQuit(self, timeout: float) -> bool:
+        """ Block for up to `timeout` seconds, waking early if the thread is told to quit """
+        return self._quitEvent.wait(timeout)
 
     def exit(self, retcode: int = 0):
-        self._isQuit = True
+        self._quitEvent.set()
         super().exit(retcode)
 
     def quit(self):
-        self._isQuit = True
+        self._quitEvent.set()
         super().quit()
 
     def terminate(self):
-        self._isQuit = True
+        self._quitEvent.set()
         super().terminate()
 
     def start(self, priority: QThread.Priority = QThread.Priority.NormalPriority):
-        self._isQuit = False
+        self._quitEvent.clear()
         super().start(priority)
 
     def run(self) -> Any:
         ret = self._target(self._args)
-        self._isQuit = True
+        self._quitEvent.set()
         return ret
 
 # pylint: enable=invalid-name
@@ -10,16 +10,330 @@
 # WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
 
-from PySide6.QtCore import QCoreApplication, QMetaObject, QRect, QSize, Qt
-from PySide6.QtGui import QFont, QIcon, QAction
-from PySide6.QtWidgets import *
+from functools import partial
+
+from PySide6.QtCore import (
+    QCoreApplication,
+    QRect,
+    QResource,
+    QSize,
+    QStringListModel,
+    Qt,
+)
+from PySide6.QtGui import QAction, QFont, QIcon, QKeySequence
+from PySide6.QtWidgets import (
+    QComboBox,
+    QFrame,
+    QGroupBox,
+    QLabel,
+    QMenu,
+    QMenuBar,
+    QProgressBar,
+    QPushButton,
+    QSizePolicy,
+    QTabWidget,
+    QTreeView,
+    QWidget,
+)
 
-from pyisotools.gui import icons_rc
 from pyisotools.gui.customwidgets import FilteredPlainTextEdit
+from pyisotools.gui.workpathing import resource_path
+
+# Regenerate with `pyside6-rcc --binary icons.qrc -o icons.rcc` after editing icons.qrc
+QResource.registerResource(str(resource_path("icons.rcc")))
+
+
+def _point_size_font(size: int) -> QFont:
+    font = QFont()
+    font.setPointSize(size)
+    return font
+
+
+_GROUP_FONT = _point_size_font(10)
+_FIELD_FONT = _point_size_font(8)
+_SCROLLBAR_OFF = Qt.ScrollBarAlwaysOff
+_ALIGN_LEFT_VCENTER = Qt.AlignLeading | Qt.AlignLeft | Qt.AlignVCenter
+
+_TAB_ORDER = (
+    "isoNameTextBox",
+    "isoGameCodeTextBox",
+    "isoMakerCodeTextBox",
+    "isoVersionTextBox",
+    "isoRegionComboBox",
+    "isoBuildDateTextBox",
+    "isoDiskIDTextBox",
+    "bannerImportButton",
+    "bannerExportButton",
+    "bannerLanguageComboBox",
+    "bannerVersionTextBox",
+    "bannerSaveButton",
+    "bannerShortNameTextBox",
+    "bannerShortMakerTextBox",
+    "bannerLongNameTextBox",
+    "bannerLongMakerTextBox",
+    "bannerDescTextBox",
+    "fileSystemTreeView",
+)
+
+# (setter, text, objectNames), each text is translated once for all of its widgets
+_UI_TEXTS = (
+    ("setText", "Open Root", ("actionOpenRoot",)),
+    ("setText", "Close", ("actionClose",)),
+    ("setText", "Build", ("actionRebuild",)),
+    ("setText", "Extract", ("actionExtract",)),
+    ("setText", "Open ISO", ("actionOpenISO",)),
+    ("setText", "Save", ("actionSave",)),
+    ("setText", "Dark Theme", ("actionDarkTheme",)),
+    ("setText", "Check Updates", ("actionCheckUpdates",)),
+    ("setTitle", "File System", ("fileSystemGroupBox",)),
+    ("setTitle", "ISO Details", ("isoDetailsGroupBox",)),
+    ("setTitle", "Banner Details", ("bannerGroupBox",)),
+    ("setTitle", "File", ("menuFile",)),
+    ("setTitle", "Help", ("menuHelp",)),
+    ("setTitle", "Settings", ("menuSettings",)),
+    ("setText", "File Location: ", ("fileSystemStartInfoLabel",)),
+    ("setText", "File Size: ", ("fileSystemSizeInfoLabel",)),
+    ("setText", "Maker Code: ", ("isoMakerCodeLabel",)),
+    ("setText", "Game Code: ", ("isoGameCodeLabel",)),
+    ("setText", "Name: ", ("isoNameLabel",)),
+    ("setText", "Disk ID:", ("isoDiskIDLabel",)),
+    ("setText", "Region:", ("isoRegionLabel",)),
+    ("setText", "Build Date: ", ("isoBuildDateLabel",)),
+    ("setText", "Version: ", ("isoVersionLabel", "bannerVersionLabel")),
+    ("setText", "Short Name:", ("bannerShortNameLabel",)),
+    ("setText", "Short Maker:", ("bannerShortMakerLabel",)),
+    ("setText", "Long Name:", ("bannerLongNameLabel",)),
+    ("setText", "Long Maker:", ("bannerLongMakerLabel",)),
+    ("setText", "Description:", ("bannerDescLabel",)),
+    ("setText", "Language:", ("bannerLanguageLabel",)),
+    ("setText", "Import", ("bannerImportButton",)),
+    ("setText", "Export", ("bannerExportButton",)),
+    ("setText", "Save Changes", ("bannerSaveButton",)),
+    ("setFormat", "Please wait... %p%", ("operationProgressBar",)),
+)
+
+# Same layout as _UI_TEXTS, applied once the Help menu is built
+_HELP_MENU_TEXTS = (
+    ("setText", "File Alignment", ("actionFile_Alignment",)),
+    ("setText", "File Position", ("actionFile_Position",)),
+    ("setText", "File Exclusion", ("actionFile_Exclusion",)),
+    ("setText", "About", ("actionAbout",)),
+)
+
+# (objectName, item texts)
+_COMBO_ITEM_TEXTS = (
+    ("isoRegionComboBox", ("NTSC-U", "PAL", "NTSC-J", "NTSC-K")),
+    (
+        "bannerLanguageComboBox",
+        ("English", "German", "French", "Spanish", "Italian", "Dutch"),
+    ),
+)
+
+# Translation context shared by every string in this module
+_CONTEXT = "MainWindow"
+
+# (objectName, shortcut), fixed key sequences are not translated
+_ACTION_SHORTCUTS = (
+    ("actionOpenRoot", "Ctrl+Shift+O"),
+    ("actionClose", "Ctrl+Shift+C"),
+    ("actionRebuild", "Ctrl+B"),
+    ("actionExtract", "Ctrl+E"),
+    ("actionOpenISO", QKeySequence.Open),
+    ("actionSave", QKeySequence.Save),
+)
+
+# Every source string above, translated together into one lookup table
+_SOURCE_TEXTS = frozenset(
+    ("pyisotools",)
+    + tuple(text for _, text, _ in _UI_TEXTS + _HELP_MENU_TEXTS)
+    + tuple(text for _, texts in _COMBO_ITEM_TEXTS for text in texts)
+)
+
+_APP_ICON = None
+
+
+def _untranslated(context, sourceText, disambiguation=None, n=-1) -> str:
+    return sourceText
+
+
+def _get_translate():
+    # Whoever installs a QTranslator must also set the "hasTranslator"
+    # application property, until then the source strings are used as-is
+    app = QCoreApplication.instance()
+    if app is not None and app.property("hasTranslator"):
+        return QCoreApplication.translate
+    return _untranslated
 
 
+def _get_app_icon() -> QIcon:
+    global _APP_ICON
+    if _APP_ICON is None:
+        _APP_ICON = QIcon()
+        _APP_ICON.addFile(":/icons/Logo", QSize(), QIcon.Normal, QIcon.Off)
+    return _APP_ICON
+
+
+# (objectName, parent objectName, geometry, alignment)
+_LABEL_SPECS = (
+    ("isoNameLabel", "isoDetailsGroupBox", (10, 20, 71, 21), None),
+    ("isoGameCodeLabel", "isoDetailsGroupBox", (10, 50, 71, 21), None),
+    ("isoMakerCodeLabel", "isoDetailsGroupBox", (10, 80, 71, 21), None),
+    ("isoVersionLabel", "isoDetailsGroupBox", (10, 110, 71, 21), None),
+    ("isoRegionLabel", "isoDetailsGroupBox", (230, 50, 61, 21), None),
+    ("isoBuildDateLabel", "isoDetailsGroupBox", (230, 80, 61, 21), None),
+    ("isoDiskIDLabel", "isoDetailsGroupBox", (230, 110, 61, 21), None),
+    ("bannerShortNameLabel", "bannerGroupBox", (10, 180, 71, 21), None),
+    ("bannerShortMakerLabel", "bannerGroupBox", (10, 210, 71, 21), None),
+    ("bannerLongNameLabel", "bannerGroupBox", (10, 240, 71, 21), None),
+    ("bannerLongMakerLabel", "bannerGroupBox", (10, 270, 71, 21), None),
+    ("bannerDescLabel", "bannerGroupBox", (10, 300, 71, 21), None),
+    (
+        "bannerLanguageLabel",
+        "bannerGroupBox",
+        (230, 20, 61, 21),
+        _ALIGN_LEFT_VCENTER,
+    ),
+    (
+        "bannerVersionLabel",
+        "bannerGroupBox",
+        (230, 50, 61, 21),
+        _ALIGN_LEFT_VCENTER,
+    ),
+)
+
+# (objectName, parent objectName, geometry)
+_BUTTON_SPECS = (
+    ("bannerImportButton", "bannerGroupBox", (10, 20, 91, 23)),
+    ("bannerExportButton", "bannerGroupBox", (110, 20, 91, 23)),
+    ("bannerSaveButton", "bannerGroupBox", (230, 92, 211, 51)),
+)
+
+
+# (objectName, parent objectName, geometry, max length, scroll policy)
+_TEXTBOX_SPECS = (
+    ("isoNameTextBox", "isoDetailsGroupBox", (90, 20, 351, 22), 0x3DF, None),
+    ("isoGameCodeTextBox", "isoDetailsGroupBox", (90, 50, 111, 22), 4, None),
+    (
+        "isoMakerCodeTextBox",
+        "isoDetailsGroupBox",
+        (90, 80, 111, 22),
+        2,
+        FilteredPlainTextEdit.ScrollHorizontal,
+    ),
+    (
+        "isoVersionTextBox",
+        "isoDetailsGroupBox",
+        (90, 110, 111, 22),
+        2,
+        FilteredPlainTextEdit.ScrollHorizontal,
+    ),
+    (
+        "isoBuildDateTextBox",
+        "isoDetailsGroupBox",
+        (300, 80, 141, 22),
+        10,
+        FilteredPlainTextEdit.ScrollHorizontal,
+    ),
+    (
+        "isoDiskIDTextBox",
+        "isoDetailsGroupBox",
+        (300, 110, 141, 22),
+        2,
+        FilteredPlainTextEdit.ScrollHorizontal,
+    ),
+    (
+        "bannerVersionTextBox",
+        "bannerGroupBox",
+        (300, 50, 141, 22),
+        4,
+        FilteredPlainTextEdit.ScrollHorizontal,
+    ),
+    (
+        "bannerShortNameTextBox",
+        "bannerGroupBox",
+        (90, 180, 351, 22),
+        32,
+        FilteredPlainTextEdit.ScrollHorizontal,
+    ),
+    (
+        "bannerShortMakerTextBox",
+        "bannerGroupBox",
+        (90, 210, 351, 22),
+        32,
+        FilteredPlainTextEdit.ScrollHorizontal,
+    ),
+    (
+        "bannerLongNameTextBox",
+        "bannerGroupBox",
+        (90, 240, 351, 22),
+        64,
+        FilteredPlainTextEdit.ScrollHorizontal,
+    ),
+    (
+        "bannerLongMakerTextBox",
+        "bannerGroupBox",
+        (90, 270, 351, 22),
+        64,
+        FilteredPlainTextEdit.ScrollHorizontal,
+    ),
+    (
+        "bannerDescTextBox",
+        "bannerGroupBox",
+        (90, 300, 351, 41),
+        128,
+        FilteredPlainTextEdit.ScrollHorizontal | FilteredPlainTextEdit.ScrollVertical,
+    ),
+)
+
+
+# Every signal is wired explicitly at the end of setupUi; connectSlotsByName is
+# not used, so `on_<objectName>_<signal>` slots will never be auto-connected.
 class Ui_MainWindow:
+    __slots__ = (
+        "actionOpenRoot",
+        "actionClose",
+        "actionRebuild",
+        "actionFile_Alignment",
+        "actionFile_Position",
+        "actionFile_Exclusion",
+        "actionAbout",
+        "actionExtract",
+        "actionOpenISO",
+        "actionSave",
+        "actionDarkTheme",
+        "actionCheckUpdates",
+        "centralwidget",
+        "fileSystemGroupBox",
+        "fileSystemTreeView",
+        "fileSystemStartInfoLabel",
+        "fileSystemStartInfoTextBox",
+        "fileSystemSizeInfoTextBox",
+        "fileSystemSizeInfoLabel",
+        "isoDetailsGroupBox",
+        "isoRegionComboBox",
+        "bannerGroupBox",
+        "bannerHFrameLine",
+        "bannerLanguageComboBox",
+        "bannerImageView",
+        "bannerComboBox",
+        "operationProgressBar",
+        "menubar",
+        "menuFile",
+        "menuHelp",
+        "menuSettings",
+        "_textSetters",
+        "_helpTextSetters",
+        "_translations",
+    ) + tuple(
+        spec[0] for spec in _LABEL_SPECS + _BUTTON_SPECS + _TEXTBOX_SPECS
+    )
+
+    def __init__(self):
+        self._translations = None
+
     def setupUi(self, MainWindow):
+        # reset_all rebuilds a visible window, so hold repaints until done
+        MainWindow.setUpdatesEnabled(False)
         if MainWindow.objectName():
             MainWindow.setObjectName("MainWindow")
         MainWindow.resize(841, 565)
@@ -30,9 +344,7 @@ class Ui_MainWindow:
         MainWindow.setSizePolicy(sizePolicy)
         MainWindow.setMinimumSize(QSize(841, 565))
         MainWindow.setMaximumSize(QSize(841, 565))
-        icon = QIcon()
-        icon.addFile(":/icons/Logo", QSize(), QIcon.Normal, QIcon.Off)
-        MainWindow.setWindowIcon(icon)
+        MainWindow.setWindowIcon(_get_app_icon())
         MainWindow.setWindowOpacity(1.000000000000000)
         MainWindow.setAutoFillBackground(False)
         MainWindow.setStyleSheet("")
@@ -47,14 +359,12 @@ class Ui_MainWindow:
         self.actionRebuild = QAction(MainWindow)
         self.actionRebuild.setObjectName("actionRebuild")
         self.actionRebuild.setEnabled(False)
-        self.actionFile_Alignment = QAction(MainWindow)
-        self.actionFile_Alignment.setObjectName("actionFile_Alignment")
-        self.actionFile_Position = QAction(MainWindow)
-        self.actionFile_Position.setObjectName("actionFile_Position")
-        self.actionFile_Exclusion = QAction(MainWindow)
-        self.actionFile_Exclusion.setObjectName("actionFile_Exclusion")
-        self.actionAbout = QAction(MainWindow)
-        self.actionAbout.setObjectName("actionAbout")
+        # The Help menu actions are built by setupHelpMenu on first open
+        self.actionFile_Alignment = None
+        self.actionFile_Position = None
+        self.actionFile_Exclusion = None
+        self.actionAbout = None
+        self._helpTextSetters = None
         self.actionExtract = QAction(MainWindow)
         self.actionExtract.setObjectName("actionExtract")
         self.actionExtract.setEnabled(False)
@@ -71,65 +381,53 @@ class Ui_MainWindow:
         self.actionCheckUpdates.setObjectName("actionCheckUpdates")
         self.actionCheckUpdates.setCheckable(True)
         self.actionCheckUpdates.setChecked(True)
+        for name, shortcut in _ACTION_SHORTCUTS:
+            getattr(self, name).setShortcut(QKeySequence(shortcut))
         self.centralwidget = QWidget(MainWindow)
         self.centralwidget.setObjectName("centralwidget")
         self.fileSystemGroupBox = QGroupBox(self.centralwidget)
         self.fileSystemGroupBox.setObjectName("fileSystemGroupBox")
         self.fileSystemGroupBox.setEnabled(False)
         self.fileSystemGroupBox.setGeometry(QRect(470, 10, 361, 491))
-        font = QFont()
-        font.setPointSize(10)
-        self.fileSystemGroupBox.setFont(font)
-        self.fileSystemTreeWidget = QTreeWidget(self.fileSystemGroupBox)
-        __qtreewidgetitem = QTreeWidgetItem()
-        __qtreewidgetitem.setText(0, "1")
-        self.fileSystemTreeWidget.setHeaderItem(__qtreewidgetitem)
-        self.fileSystemTreeWidget.setObjectName("fileSystemTreeWidget")
-        self.fileSystemTreeWidget.setGeometry(QRect(10, 20, 341, 431))
-        font1 = QFont()
-        font1.setPointSize(8)
-        self.fileSystemTreeWidget.setFont(font1)
-        self.fileSystemTreeWidget.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.fileSystemTreeWidget.setFrameShadow(QFrame.Sunken)
-        self.fileSystemTreeWidget.setAlternatingRowColors(False)
-        self.fileSystemTreeWidget.setRootIsDecorated(True)
-        self.fileSystemTreeWidget.setHeaderHidden(True)
+        self.fileSystemGroupBox.setFont(_GROUP_FONT)
+        self.fileSystemTreeView = QTreeView(self.fileSystemGroupBox)
+        self.fileSystemTreeView.setObjectName("fileSystemTreeView")
+        self.fileSystemTreeView.setGeometry(QRect(10, 20, 341, 431))
+        self.fileSystemTreeView.setFont(_FIELD_FONT)
+        self.fileSystemTreeView.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.fileSystemTreeView.setFrameShadow(QFrame.Sunken)
+        self.fileSystemTreeView.setAlternatingRowColors(False)
+        self.fileSystemTreeView.setRootIsDecorated(True)
+        self.fileSystemTreeView.setHeaderHidden(True)
+        self.fileSystemTreeView.setUniformRowHeights(True)
         self.fileSystemStartInfoLabel = QLabel(self.fileSystemGroupBox)
         self.fileSystemStartInfoLabel.setObjectName("fileSystemStartInfoLabel")
         self.fileSystemStartInfoLabel.setGeometry(QRect(10, 460, 71, 20))
-        self.fileSystemStartInfoLabel.setFont(font1)
+        self.fileSystemStartInfoLabel.setFont(_FIELD_FONT)
         self.fileSystemStartInfoLabel.setFrameShape(QFrame.NoFrame)
         self.fileSystemStartInfoLabel.setFrameShadow(QFrame.Plain)
         self.fileSystemStartInfoLabel.setTextFormat(Qt.PlainText)
-        self.fileSystemStartInfoLabel.setAlignment(
-            Qt.AlignLeading | Qt.AlignLeft | Qt.AlignVCenter
-        )
+        self.fileSystemStartInfoLabel.setAlignment(_ALIGN_LEFT_VCENTER)
         self.fileSystemStartInfoTextBox = FilteredPlainTextEdit(self.fileSystemGroupBox)
         self.fileSystemStartInfoTextBox.setObjectName("fileSystemStartInfoTextBox")
         self.fileSystemStartInfoTextBox.setGeometry(QRect(90, 460, 81, 22))
-        self.fileSystemStartInfoTextBox.setFont(font1)
-        self.fileSystemStartInfoTextBox.setVerticalScrollBarPolicy(
-            Qt.ScrollBarAlwaysOff
-        )
-        self.fileSystemStartInfoTextBox.setHorizontalScrollBarPolicy(
-            Qt.ScrollBarAlwaysOff
-        )
+        self.fileSystemStartInfoTextBox.setFont(_FIELD_FONT)
+        self.fileSystemStartInfoTextBox.setVerticalScrollBarPolicy(_SCROLLBAR_OFF)
+        self.fileSystemStartInfoTextBox.setHorizontalScrollBarPolicy(_SCROLLBAR_OFF)
         self.fileSystemStartInfoTextBox.setReadOnly(True)
         self.fileSystemStartInfoTextBox.setTabStopDistance(40)
         self.fileSystemSizeInfoTextBox = FilteredPlainTextEdit(self.fileSystemGroupBox)
         self.fileSystemSizeInfoTextBox.setObjectName("fileSystemSizeInfoTextBox")
         self.fileSystemSizeInfoTextBox.setGeometry(QRect(270, 460, 81, 22))
-        self.fileSystemSizeInfoTextBox.setFont(font1)
-        self.fileSystemSizeInfoTextBox.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.fileSystemSizeInfoTextBox.setHorizontalScrollBarPolicy(
-            Qt.ScrollBarAlwaysOff
-        )
+        self.fileSystemSizeInfoTextBox.setFont(_FIELD_FONT)
+        self.fileSystemSizeInfoTextBox.setVerticalScrollBarPolicy(_SCROLLBAR_OFF)
+        self.fileSystemSizeInfoTextBox.setHorizontalScrollBarPolicy(_SCROLLBAR_OFF)
         self.fileSystemSizeInfoTextBox.setReadOnly(True)
         self.fileSystemSizeInfoTextBox.setTabStopDistance(40)
         self.fileSystemSizeInfoLabel = QLabel(self.fileSystemGroupBox)
         self.fileSystemSizeInfoLabel.setObjectName("fileSystemSizeInfoLabel")
         self.fileSystemSizeInfoLabel.setGeometry(QRect(190, 460, 71, 20))
-        self.fileSystemSizeInfoLabel.setFont(font1)
+        self.fileSystemSizeInfoLabel.setFont(_FIELD_FONT)
         self.fileSystemSizeInfoLabel.setLayoutDirection(Qt.LeftToRight)
         self.fileSystemSizeInfoLabel.setFrameShape(QFrame.NoFrame)
         self.fileSystemSizeInfoLabel.setFrameShadow(QFrame.Plain)
@@ -141,186 +439,45 @@ class Ui_MainWindow:
         self.isoDetailsGroupBox.setObjectName("isoDetailsGroupBox")
         self.isoDetailsGroupBox.setEnabled(False)
         self.isoDetailsGroupBox.setGeometry(QRect(10, 10, 451, 141))
-        self.isoDetailsGroupBox.setFont(font)
-        self.isoMakerCodeLabel = QLabel(self.isoDetailsGroupBox)
-        self.isoMakerCodeLabel.setObjectName("isoMakerCodeLabel")
-        self.isoMakerCodeLabel.setGeometry(QRect(10, 80, 71, 21))
-        self.isoMakerCodeLabel.setFont(font1)
-        self.isoGameCodeTextBox = FilteredPlainTextEdit(self.isoDetailsGroupBox)
-        self.isoGameCodeTextBox.setObjectName("isoGameCodeTextBox")
-        self.isoGameCodeTextBox.setGeometry(QRect(90, 50, 111, 22))
-        self.isoGameCodeTextBox.setFont(font1)
-        self.isoGameCodeTextBox.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.isoGameCodeTextBox.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.isoGameCodeTextBox.setTabStopDistance(40)
-        self.isoGameCodeTextBox.setMaxLength(4)
-        self.isoNameTextBox = FilteredPlainTextEdit(self.isoDetailsGroupBox)
-        self.isoNameTextBox.setObjectName("isoNameTextBox")
-        self.isoNameTextBox.setEnabled(False)
-        self.isoNameTextBox.setGeometry(QRect(90, 20, 351, 22))
-        self.isoNameTextBox.setFont(font1)
-        self.isoNameTextBox.setMouseTracking(False)
-        self.isoNameTextBox.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.isoNameTextBox.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.isoNameTextBox.setTabStopDistance(40)
-        self.isoNameTextBox.setMaxLength(0x3DF)
-        self.isoGameCodeLabel = QLabel(self.isoDetailsGroupBox)
-        self.isoGameCodeLabel.setObjectName("isoGameCodeLabel")
-        self.isoGameCodeLabel.setGeometry(QRect(10, 50, 71, 21))
-        self.isoGameCodeLabel.setFont(font1)
-        self.isoNameLabel = QLabel(self.isoDetailsGroupBox)
-        self.isoNameLabel.setObjectName("isoNameLabel")
-        self.isoNameLabel.setGeometry(QRect(10, 20, 71, 21))
-        self.isoNameLabel.setFont(font1)
-        self.isoMakerCodeTextBox = FilteredPlainTextEdit(self.isoDetailsGroupBox)
-        self.isoMakerCodeTextBox.setObjectName("isoMakerCodeTextBox")
-        self.isoMakerCodeTextBox.setGeometry(QRect(90, 80, 111, 22))
-        self.isoMakerCodeTextBox.setFont(font1)
-        self.isoMakerCodeTextBox.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.isoMakerCodeTextBox.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.isoMakerCodeTextBox.setTabStopDistance(40)
-        self.isoMakerCodeTextBox.setScrollPolicy(FilteredPlainTextEdit.ScrollHorizontal)
-        self.isoMakerCodeTextBox.setMaxLength(2)
-        self.isoDiskIDLabel = QLabel(self.isoDetailsGroupBox)
-        self.isoDiskIDLabel.setObjectName("isoDiskIDLabel")
-        self.isoDiskIDLabel.setGeometry(QRect(230, 110, 61, 21))
-        self.isoDiskIDLabel.setFont(font1)
-        self.isoDiskIDTextBox = FilteredPlainTextEdit(self.isoDetailsGroupBox)
-        self.isoDiskIDTextBox.setObjectName("isoDiskIDTextBox")
-        self.isoDiskIDTextBox.setGeometry(QRect(300, 110, 141, 22))
-        self.isoDiskIDTextBox.setFont(font1)
-        self.isoDiskIDTextBox.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.isoDiskIDTextBox.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.isoDiskIDTextBox.setTabStopDistance(40)
-        self.isoDiskIDTextBox.setScrollPolicy(FilteredPlainTextEdit.ScrollHorizontal)
-        self.isoDiskIDTextBox.setMaxLength(2)
-        self.isoRegionLabel = QLabel(self.isoDetailsGroupBox)
-        self.isoRegionLabel.setObjectName("isoRegionLabel")
-        self.isoRegionLabel.setGeometry(QRect(230, 50, 61, 21))
-        self.isoRegionLabel.setFont(font1)
-        self.isoBuildDateLabel = QLabel(self.isoDetailsGroupBox)
-        self.isoBuildDateLabel.setObjectName("isoBuildDateLabel")
-        self.isoBuildDateLabel.setGeometry(QRect(230, 80, 61, 21))
-        self.isoBuildDateLabel.setFont(font1)
-        self.isoBuildDateTextBox = FilteredPlainTextEdit(self.isoDetailsGroupBox)
-        self.isoBuildDateTextBox.setObjectName("isoBuildDateTextBox")
-        self.isoBuildDateTextBox.setGeometry(QRect(300, 80, 141, 22))
-        self.isoBuildDateTextBox.setFont(font1)
-        self.isoBuildDateTextBox.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.isoBuildDateTextBox.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.isoBuildDateTextBox.setTabStopDistance(40)
-        self.isoBuildDateTextBox.setScrollPolicy(FilteredPlainTextEdit.ScrollHorizontal)
-        self.isoBuildDateTextBox.setMaxLength(10)
-        self.isoVersionLabel = QLabel(self.isoDetailsGroupBox)
-        self.isoVersionLabel.setObjectName("isoVersionLabel")
-        self.isoVersionLabel.setGeometry(QRect(10, 110, 71, 21))
-        self.isoVersionLabel.setFont(font1)
-        self.isoVersionTextBox = FilteredPlainTextEdit(self.isoDetailsGroupBox)
-        self.isoVersionTextBox.setObjectName("isoVersionTextBox")
-        self.isoVersionTextBox.setGeometry(QRect(90, 110, 111, 22))
-        self.isoVersionTextBox.setFont(font1)
-        self.isoVersionTextBox.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.isoVersionTextBox.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.isoVersionTextBox.setTabStopDistance(40)
-        self.isoVersionTextBox.setScrollPolicy(FilteredPlainTextEdit.ScrollHorizontal)
-        self.isoVersionTextBox.setMaxLength(2)
+        self.isoDetailsGroupBox.setFont(_GROUP_FONT)
         self.isoRegionComboBox = QComboBox(self.isoDetailsGroupBox)
-        self.isoRegionComboBox.addItem("")
-        self.isoRegionComboBox.addItem("")
-        self.isoRegionComboBox.addItem("")
-        self.isoRegionComboBox.addItem("")
+        self.isoRegionComboBox.setModel(QStringListModel(self.isoRegionComboBox))
         self.isoRegionComboBox.setObjectName("isoRegionComboBox")
         self.isoRegionComboBox.setGeometry(QRect(300, 50, 141, 22))
-        self.isoRegionComboBox.setFont(font1)
+        self.isoRegionComboBox.setFont(_FIELD_FONT)
         self.bannerGroupBox = QGroupBox(self.centralwidget)
         self.bannerGroupBox.setObjectName("bannerGroupBox")
         self.bannerGroupBox.setEnabled(False)
         self.bannerGroupBox.setGeometry(QRect(10, 150, 451, 351))
-        self.bannerGroupBox.setFont(font)
+        self.bannerGroupBox.setFont(_GROUP_FONT)
         self.bannerGroupBox.setAutoFillBackground(True)
-        self.bannerShortNameTextBox = FilteredPlainTextEdit(self.bannerGroupBox)
-        self.bannerShortNameTextBox.setObjectName("bannerShortNameTextBox")
-        self.bannerShortNameTextBox.setGeometry(QRect(90, 180, 351, 22))
-        self.bannerShortNameTextBox.setFont(font1)
-        self.bannerShortNameTextBox.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.bannerShortNameTextBox.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.bannerShortNameTextBox.setTabStopDistance(40)
-        self.bannerShortNameTextBox.setScrollPolicy(
-            FilteredPlainTextEdit.ScrollHorizontal
-        )
-        self.bannerShortNameTextBox.setMaxLength(32)
-        self.bannerShortMakerTextBox = FilteredPlainTextEdit(self.bannerGroupBox)
-        self.bannerShortMakerTextBox.setObjectName("bannerShortMakerTextBox")
-        self.bannerShortMakerTextBox.setGeometry(QRect(90, 210, 351, 22))
-        self.bannerShortMakerTextBox.setFont(font1)
-        self.bannerShortMakerTextBox.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.bannerShortMakerTextBox.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.bannerShortMakerTextBox.setTabStopDistance(40)
-        self.bannerShortMakerTextBox.setScrollPolicy(
-            FilteredPlainTextEdit.ScrollHorizontal
-        )
-        self.bannerShortMakerTextBox.setMaxLength(32)
-        self.bannerLongNameTextBox = FilteredPlainTextEdit(self.bannerGroupBox)
-        self.bannerLongNameTextBox.setObjectName("bannerLongNameTextBox")
-        self.bannerLongNameTextBox.setGeometry(QRect(90, 240, 351, 22))
-        self.bannerLongNameTextBox.setFont(font1)
-        self.bannerLongNameTextBox.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.bannerLongNameTextBox.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.bannerLongNameTextBox.setTabStopDistance(40)
-        self.bannerLongNameTextBox.setScrollPolicy(
-            FilteredPlainTextEdit.ScrollHorizontal
-        )
-        self.bannerLongNameTextBox.setMaxLength(64)
-        self.bannerLongMakerTextBox = FilteredPlainTextEdit(self.bannerGroupBox)
-        self.bannerLongMakerTextBox.setObjectName("bannerLongMakerTextBox")
-        self.bannerLongMakerTextBox.setGeometry(QRect(90, 270, 351, 22))
-        self.bannerLongMakerTextBox.setFont(font1)
-        self.bannerLongMakerTextBox.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.bannerLongMakerTextBox.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.bannerLongMakerTextBox.setTabStopDistance(40)
-        self.bannerLongMakerTextBox.setScrollPolicy(
-            FilteredPlainTextEdit.ScrollHorizontal
-        )
-        self.bannerLongMakerTextBox.setMaxLength(64)
-        self.bannerDescTextBox = FilteredPlainTextEdit(self.bannerGroupBox)
-        self.bannerDescTextBox.setObjectName("bannerDescTextBox")
-        self.bannerDescTextBox.setGeometry(QRect(90, 300, 351, 41))
-        self.bannerDescTextBox.setFont(font1)
-        self.bannerDescTextBox.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.bannerDescTextBox.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.bannerDescTextBox.setTabStopDistance(40)
-        self.bannerDescTextBox.setScrollPolicy(
-            FilteredPlainTextEdit.ScrollHorizontal
-            | FilteredPlainTextEdit.ScrollVertical
-        )
-        self.bannerDescTextBox.setMaxLength(128)
-        self.bannerShortNameLabel = QLabel(self.bannerGroupBox)
-        self.bannerShortNameLabel.setObjectName("bannerShortNameLabel")
-        self.bannerShortNameLabel.setGeometry(QRect(10, 180, 71, 21))
-        self.bannerShortNameLabel.setFont(font1)
-        self.bannerShortMakerLabel = QLabel(self.bannerGroupBox)
-        self.bannerShortMakerLabel.setObjectName("bannerShortMakerLabel")
-        self.bannerShortMakerLabel.setGeometry(QRect(10, 210, 71, 21))
-        self.bannerShortMakerLabel.setFont(font1)
-        self.bannerLongNameLabel = QLabel(self.bannerGroupBox)
-        self.bannerLongNameLabel.setObjectName("bannerLongNameLabel")
-        self.bannerLongNameLabel.setGeometry(QRect(10, 240, 71, 21))
-        self.bannerLongNameLabel.setFont(font1)
-        self.bannerLongMakerLabel = QLabel(self.bannerGroupBox)
-        self.bannerLongMakerLabel.setObjectName("bannerLongMakerLabel")
-        self.bannerLongMakerLabel.setGeometry(QRect(10, 270, 71, 21))
-        self.bannerLongMakerLabel.setFont(font1)
-        self.bannerDescLabel = QLabel(self.bannerGroupBox)
-        self.bannerDescLabel.setObjectName("bannerDescLabel")
-        self.bannerDescLabel.setGeometry(QRect(10, 300, 71, 21))
-        self.bannerDescLabel.setFont(font1)
-        self.bannerVersionLabel = QLabel(self.bannerGroupBox)
-        self.bannerVersionLabel.setObjectName("bannerVersionLabel")
-        self.bannerVersionLabel.setGeometry(QRect(230, 50, 61, 21))
-        self.bannerVersionLabel.setFont(font1)
-        self.bannerVersionLabel.setAlignment(
-            Qt.AlignLeading | Qt.AlignLeft | Qt.AlignVCenter
-        )
+        for name, parent, geometry, alignment in _LABEL_SPECS:
+            label = QLabel(getattr(self, parent))
+            label.setObjectName(name)
+            label.setGeometry(QRect(*geometry))
+            label.setFont(_FIELD_FONT)
+            if alignment is not None:
+                label.setAlignment(alignment)
+            setattr(self, name, label)
+        for name, parent, geometry in _BUTTON_SPECS:
+            button = QPushButton(getattr(self, parent))
+            button.setObjectName(name)
+            button.setGeometry(QRect(*geometry))
+            button.setFont(_FIELD_FONT)
+            setattr(self, name, button)
+        for name, parent, geometry, maxLength, scrollPolicy in _TEXTBOX_SPECS:
+            textBox = FilteredPlainTextEdit(getattr(self, parent))
+            textBox.setObjectName(name)
+            textBox.setGeometry(QRect(*geometry))
+            textBox.setFont(_FIELD_FONT)
+            textBox.setVerticalScrollBarPolicy(_SCROLLBAR_OFF)
+            textBox.setHorizontalScrollBarPolicy(_SCROLLBAR_OFF)
+            textBox.setTabStopDistance(40)
+            textBox.setMaxLength(maxLength)
+            if scrollPolicy is not None:
+                textBox.setScrollPolicy(scrollPolicy)
+            setattr(self, name, textBox)
+        self.isoNameTextBox.setEnabled(False)
         self.bannerHFrameLine = QFrame(self.bannerGroupBox)
         self.bannerHFrameLine.setObjectName("bannerHFrameLine")
         self.bannerHFrameLine.setEnabled(False)
@@ -330,46 +487,13 @@ class Ui_MainWindow:
         self.bannerHFrameLine.setFrameShadow(QFrame.Raised)
         self.bannerHFrameLine.setLineWidth(1)
         self.bannerHFrameLine.setMidLineWidth(0)
-        self.bannerVersionTextBox = FilteredPlainTextEdit(self.bannerGroupBox)
-        self.bannerVersionTextBox.setObjectName("bannerVersionTextBox")
-        self.bannerVersionTextBox.setGeometry(QRect(300, 50, 141, 22))
-        self.bannerVersionTextBox.setFont(font1)
-        self.bannerVersionTextBox.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.bannerVersionTextBox.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.bannerVersionTextBox.setTabStopDistance(40)
-        self.bannerVersionTextBox.setScrollPolicy(
-            FilteredPlainTextEdit.ScrollHorizontal
-        )
-        self.bannerVersionTextBox.setMaxLength(4)
-        self.bannerLanguageLabel = QLabel(self.bannerGroupBox)
-        self.bannerLanguageLabel.setObjectName("bannerLanguageLabel")
-        self.bannerLanguageLabel.setGeometry(QRect(230, 20, 61, 21))
-        self.bannerLanguageLabel.setFont(font1)
-        self.bannerLanguageLabel.setAlignment(
-            Qt.AlignLeading | Qt.AlignLeft | Qt.AlignVCenter
-        )
         self.bannerLanguageComboBox = QComboBox(self.bannerGroupBox)
-        self.bannerLanguageComboBox.addItem("")
-        self.bannerLanguageComboBox.addItem("")
-        self.bannerLanguageComboBox.addItem("")
-        self.bannerLanguageComboBox.addItem("")
-        self.bannerLanguageComboBox.addItem("")
-        self.bannerLanguageComboBox.addItem("")
+        self.bannerLanguageComboBox.setModel(
+            QStringListModel(self.bannerLanguageComboBox)
+        )
         self.bannerLanguageComboBox.setObjectName("bannerLanguageComboBox")
         self.bannerLanguageComboBox.setGeometry(QRect(300, 20, 141, 22))
-        self.bannerLanguageComboBox.setFont(font1)
-        self.bannerImportButton = QPushButton(self.bannerGroupBox)
-        self.bannerImportButton.setObjectName("bannerImportButton")
-        self.bannerImportButton.setGeometry(QRect(10, 20, 91, 23))
-        self.bannerImportButton.setFont(font1)
-        self.bannerExportButton = QPushButton(self.bannerGroupBox)
-        self.bannerExportButton.setObjectName("bannerExportButton")
-        self.bannerExportButton.setGeometry(QRect(110, 20, 91, 23))
-        self.bannerExportButton.setFont(font1)
-        self.bannerSaveButton = QPushButton(self.bannerGroupBox)
-        self.bannerSaveButton.setObjectName("bannerSaveButton")
-        self.bannerSaveButton.setGeometry(QRect(230, 92, 211, 51))
-        self.bannerSaveButton.setFont(font1)
+        self.bannerLanguageComboBox.setFont(_FIELD_FONT)
         self.bannerImageView = QLabel(self.bannerGroupBox)
         self.bannerImageView.setObjectName("bannerImageView")
         self.bannerImageView.setEnabled(False)
@@ -386,7 +510,7 @@ class Ui_MainWindow:
         self.bannerComboBox = QComboBox(self.bannerGroupBox)
         self.bannerComboBox.setObjectName("bannerComboBox")
         self.bannerComboBox.setGeometry(QRect(10, 120, 190, 22))
-        self.bannerComboBox.setFont(font1)
+        self.bannerComboBox.setFont(_FIELD_FONT)
         self.operationProgressBar = QProgressBar(self.centralwidget)
         self.operationProgressBar.setObjectName("operationProgressBar")
         self.operationProgressBar.setGeometry(QRect(10, 510, 821, 21))
@@ -408,23 +532,9 @@ class Ui_MainWindow:
         self.menuSettings = QMenu(self.menubar)
         self.menuSettings.setObjectName("menuSettings")
         MainWindow.setMenuBar(self.menubar)
-        QWidget.setTabOrder(self.isoNameTextBox, self.isoGameCodeTextBox)
-        QWidget.setTabOrder(self.isoGameCodeTextBox, self.isoMakerCodeTextBox)
-        QWidget.setTabOrder(self.isoMakerCodeTextBox, self.isoVersionTextBox)
-        QWidget.setTabOrder(self.isoVersionTextBox, self.isoRegionComboBox)
-        QWidget.setTabOrder(self.isoRegionComboBox, self.isoBuildDateTextBox)
-        QWidget.setTabOrder(self.isoBuildDateTextBox, self.isoDiskIDTextBox)
-        QWidget.setTabOrder(self.isoDiskIDTextBox, self.bannerImportButton)
-        QWidget.setTabOrder(self.bannerImportButton, self.bannerExportButton)
-        QWidget.setTabOrder(self.bannerExportButton, self.bannerLanguageComboBox)
-        QWidget.setTabOrder(self.bannerLanguageComboBox, self.bannerVersionTextBox)
-        QWidget.setTabOrder(self.bannerVersionTextBox, self.bannerSaveButton)
-        QWidget.setTabOrder(self.bannerSaveButton, self.bannerShortNameTextBox)
-        QWidget.setTabOrder(self.bannerShortNameTextBox, self.bannerShortMakerTextBox)
-        QWidget.setTabOrder(self.bannerShortMakerTextBox, self.bannerLongNameTextBox)
-        QWidget.setTabOrder(self.bannerLongNameTextBox, self.bannerLongMakerTextBox)
-        QWidget.setTabOrder(self.bannerLongMakerTextBox, self.bannerDescTextBox)
-        QWidget.setTabOrder(self.bannerDescTextBox, self.fileSystemTreeWidget)
+        tabOrder = [getattr(self, name) for name in _TAB_ORDER]
+        for first, second in zip(tabOrder, tabOrder[1:]):
+            QWidget.setTabOrder(first, second)
 
         self.menubar.addAction(self.menuFile.menuAction())
         self.menubar.addAction(self.menuSettings.menuAction())
@@ -436,14 +546,10 @@ class Ui_MainWindow:
         self.menuFile.addSeparator()
         self.menuFile.addAction(self.actionRebuild)
         self.menuFile.addAction(self.actionExtract)
-        self.menuHelp.addAction(self.actionFile_Alignment)
-        self.menuHelp.addAction(self.actionFile_Position)
-        self.menuHelp.addAction(self.actionFile_Exclusion)
-        self.menuHelp.addSeparator()
-        self.menuHelp.addAction(self.actionAbout)
         self.menuSettings.addAction(self.actionDarkTheme)
         self.menuSettings.addAction(self.actionCheckUpdates)
 
+        self._textSetters = self._bindTextSetters(_UI_TEXTS)
         self.retranslateUi(MainWindow)
         self.bannerImportButton.released.connect(MainWindow.bnr_load_dialog)
         self.bannerExportButton.released.connect(MainWindow.bnr_save_dialog)
@@ -456,198 +562,96 @@ class Ui_MainWindow:
         self.actionClose.triggered.connect(MainWindow.reset_all)
         self.actionRebuild.triggered.connect(MainWindow.iso_build_dialog)
         self.actionExtract.triggered.connect(MainWindow.iso_extract_dialog)
-        self.actionAbout.triggered.connect(MainWindow.help_about)
-        self.actionFile_Alignment.triggered.connect(MainWindow.help_file_alignment)
-        self.actionFile_Position.triggered.connect(MainWindow.help_file_position)
-        self.actionFile_Exclusion.triggered.connect(MainWindow.help_file_exclusion)
         self.actionOpenISO.triggered.connect(MainWindow.iso_load_iso_dialog)
-        self.fileSystemTreeWidget.customContextMenuRequested.connect(
+        self.fileSystemTreeView.customContextMenuRequested.connect(
             MainWindow.file_system_context_menu
         )
-        self.fileSystemTreeWidget.itemClicked.connect(MainWindow.file_system_set_fields)
+        self.fileSystemTreeView.clicked.connect(MainWindow.file_system_set_fields)
         self.actionSave.triggered.connect(MainWindow.save_all_wrapped)
         self.actionDarkTheme.toggled.connect(MainWindow.update_dark)
-
-        QMetaObject.connectSlotsByName(MainWindow)
+        self.menuHelp.aboutToShow.connect(partial(self.setupHelpMenu, MainWindow))
+        MainWindow.setUpdatesEnabled(True)
 
     # setupUi
 
+    def setupHelpMenu(self, MainWindow):
+        if self.actionAbout is not None:
+            return
+
+        self.actionFile_Alignment = QAction(MainWindow)
+        self.actionFile_Alignment.setObjectName("actionFile_Alignment")
+        self.actionFile_Position = QAction(MainWindow)
+        self.actionFile_Position.setObjectName("actionFile_Position")
+        self.actionFile_Exclusion = QAction(MainWindow)
+        self.actionFile_Exclusion.setObjectName("actionFile_Exclusion")
+        self.actionAbout = QAction(MainWindow)
+        self.actionAbout.setObjectName("actionAbout")
+
+        self.menuHelp.addAction(self.actionFile_Alignment)
+        self.menuHelp.addAction(self.actionFile_Position)
+        self.menuHelp.addAction(self.actionFile_Exclusion)
+        self.menuHelp.addSeparator()
+        self.menuHelp.addAction(self.actionAbout)
+
+        self._helpTextSetters = self._bindTextSetters(_HELP_MENU_TEXTS)
+        self.retranslateHelpMenu()
+        self.actionAbout.triggered.connect(MainWindow.help_about)
+        self.actionFile_Alignment.triggered.connect(MainWindow.help_file_alignment)
+        self.actionFile_Position.triggered.connect(MainWindow.help_file_position)
+        self.actionFile_Exclusion.triggered.connect(MainWindow.help_file_exclusion)
+
+    # setupHelpMenu
+
     def retranslateUi(self, MainWindow):
-        MainWindow.setWindowTitle(
-            QCoreApplication.translate("MainWindow", "pyisotools", None)
-        )
-        self.actionOpenRoot.setText(
-            QCoreApplication.translate("MainWindow", "Open Root", None)
-        )
-        # if QT_CONFIG(shortcut)
-        self.actionOpenRoot.setShortcut(
-            QCoreApplication.translate("MainWindow", "Ctrl+Shift+O", None)
-        )
-        # endif // QT_CONFIG(shortcut)
-        self.actionClose.setText(
-            QCoreApplication.translate("MainWindow", "Close", None)
-        )
-        # if QT_CONFIG(shortcut)
-        self.actionClose.setShortcut(
-            QCoreApplication.translate("MainWindow", "Ctrl+Shift+C", None)
-        )
-        # endif // QT_CONFIG(shortcut)
-        self.actionRebuild.setText(
-            QCoreApplication.translate("MainWindow", "Build", None)
-        )
-        # if QT_CONFIG(shortcut)
-        self.actionRebuild.setShortcut(
-            QCoreApplication.translate("MainWindow", "Ctrl+B", None)
-        )
-        # endif // QT_CONFIG(shortcut)
-        self.actionFile_Alignment.setText(
-            QCoreApplication.translate("MainWindow", "File Alignment", None)
-        )
-        self.actionFile_Position.setText(
-            QCoreApplication.translate("MainWindow", "File Position", None)
-        )
-        self.actionFile_Exclusion.setText(
-            QCoreApplication.translate("MainWindow", "File Exclusion", None)
-        )
-        self.actionAbout.setText(
-            QCoreApplication.translate("MainWindow", "About", None)
-        )
-        self.actionExtract.setText(
-            QCoreApplication.translate("MainWindow", "Extract", None)
-        )
-        # if QT_CONFIG(shortcut)
-        self.actionExtract.setShortcut(
-            QCoreApplication.translate("MainWindow", "Ctrl+E", None)
-        )
-        # endif // QT_CONFIG(shortcut)
-        self.actionOpenISO.setText(
-            QCoreApplication.translate("MainWindow", "Open ISO", None)
-        )
-        # if QT_CONFIG(shortcut)
-        self.actionOpenISO.setShortcut(
-            QCoreApplication.translate("MainWindow", "Ctrl+O", None)
-        )
-        # endif // QT_CONFIG(shortcut)
-        self.actionSave.setText(QCoreApplication.translate("MainWindow", "Save", None))
-        # if QT_CONFIG(shortcut)
-        self.actionSave.setShortcut(
-            QCoreApplication.translate("MainWindow", "Ctrl+S", None)
-        )
-        # endif // QT_CONFIG(shortcut)
-        self.actionDarkTheme.setText(
-            QCoreApplication.translate("MainWindow", "Dark Theme", None)
-        )
-        self.actionCheckUpdates.setText(
-            QCoreApplication.translate("MainWindow", "Check Updates", None)
-        )
-        self.fileSystemGroupBox.setTitle(
-            QCoreApplication.translate("MainWindow", "File System", None)
-        )
-        self.fileSystemStartInfoLabel.setText(
-            QCoreApplication.translate("MainWindow", "File Location: ", None)
-        )
-        self.fileSystemSizeInfoLabel.setText(
-            QCoreApplication.translate("MainWindow", "File Size: ", None)
-        )
-        self.isoDetailsGroupBox.setTitle(
-            QCoreApplication.translate("MainWindow", "ISO Details", None)
-        )
-        self.isoMakerCodeLabel.setText(
-            QCoreApplication.translate("MainWindow", "Maker Code: ", None)
-        )
-        self.isoGameCodeLabel.setText(
-            QCoreApplication.translate("MainWindow", "Game Code: ", None)
-        )
-        self.isoNameLabel.setText(
-            QCoreApplication.translate("MainWindow", "Name: ", None)
-        )
-        self.isoDiskIDLabel.setText(
-            QCoreApplication.translate("MainWindow", "Disk ID:", None)
-        )
-        self.isoRegionLabel.setText(
-            QCoreApplication.translate("MainWindow", "Region:", None)
-        )
-        self.isoBuildDateLabel.setText(
-            QCoreApplication.translate("MainWindow", "Build Date: ", None)
-        )
-        self.isoVersionLabel.setText(
-            QCoreApplication.translate("MainWindow", "Version: ", None)
-        )
-        self.isoRegionComboBox.setItemText(
-            0, QCoreApplication.translate("MainWindow", "NTSC-U", None)
-        )
-        self.isoRegionComboBox.setItemText(
-            1, QCoreApplication.translate("MainWindow", "PAL", None)
-        )
-        self.isoRegionComboBox.setItemText(
-            2, QCoreApplication.translate("MainWindow", "NTSC-J", None)
-        )
-        self.isoRegionComboBox.setItemText(
-            3, QCoreApplication.translate("MainWindow", "NTSC-K", None)
-        )
+        # setupUi already holds updates, otherwise batch the repaint here
+        holdUpdates = MainWindow.updatesEnabled()
+        if holdUpdates:
+            MainWindow.setUpdatesEnabled(False)
 
-        self.bannerGroupBox.setTitle(
-            QCoreApplication.translate("MainWindow", "Banner Details", None)
-        )
-        self.bannerLongMakerTextBox.setPlainText("")
-        self.bannerDescTextBox.setPlainText("")
-        self.bannerShortNameLabel.setText(
-            QCoreApplication.translate("MainWindow", "Short Name:", None)
-        )
-        self.bannerShortMakerLabel.setText(
-            QCoreApplication.translate("MainWindow", "Short Maker:", None)
-        )
-        self.bannerLongNameLabel.setText(
-            QCoreApplication.translate("MainWindow", "Long Name:", None)
-        )
-        self.bannerLongMakerLabel.setText(
-            QCoreApplication.translate("MainWindow", "Long Maker:", None)
-        )
-        self.bannerDescLabel.setText(
-            QCoreApplication.translate("MainWindow", "Description:", None)
-        )
-        self.bannerVersionLabel.setText(
-            QCoreApplication.translate("MainWindow", "Version: ", None)
-        )
-        self.bannerLanguageLabel.setText(
-            QCoreApplication.translate("MainWindow", "Language:", None)
-        )
-        self.bannerLanguageComboBox.setItemText(
-            0, QCoreApplication.translate("MainWindow", "English", None)
-        )
-        self.bannerLanguageComboBox.setItemText(
-            1, QCoreApplication.translate("MainWindow", "German", None)
-        )
-        self.bannerLanguageComboBox.setItemText(
-            2, QCoreApplication.translate("MainWindow", "French", None)
-        )
-        self.bannerLanguageComboBox.setItemText(
-            3, QCoreApplication.translate("MainWindow", "Spanish", None)
-        )
-        self.bannerLanguageComboBox.setItemText(
-            4, QCoreApplication.translate("MainWindow", "Italian", None)
-        )
-        self.bannerLanguageComboBox.setItemText(
-            5, QCoreApplication.translate("MainWindow", "Dutch", None)
-        )
+        translations = self._getTranslations()
+        MainWindow.setWindowTitle(translations["pyisotools"])
+        self._applyTexts(self._textSetters)
+        for name, texts in _COMBO_ITEM_TEXTS:
+            comboBox = getattr(self, name)
+            index = comboBox.currentIndex()
+            comboBox.blockSignals(True)
+            comboBox.model().setStringList([translations[text] for text in texts])
+            comboBox.setCurrentIndex(max(index, 0))
+            comboBox.blockSignals(False)
 
-        self.bannerImportButton.setText(
-            QCoreApplication.translate("MainWindow", "Import", None)
-        )
-        self.bannerExportButton.setText(
-            QCoreApplication.translate("MainWindow", "Export", None)
-        )
-        self.bannerSaveButton.setText(
-            QCoreApplication.translate("MainWindow", "Save Changes", None)
-        )
-        self.bannerImageView.setText("")
-        self.operationProgressBar.setFormat(
-            QCoreApplication.translate("MainWindow", "Please wait... %p%", None)
-        )
-        self.menuFile.setTitle(QCoreApplication.translate("MainWindow", "File", None))
-        self.menuHelp.setTitle(QCoreApplication.translate("MainWindow", "Help", None))
-        self.menuSettings.setTitle(
-            QCoreApplication.translate("MainWindow", "Settings", None)
-        )
+        if self.actionAbout is not None:
+            self.retranslateHelpMenu()
+
+        if holdUpdates:
+            MainWindow.setUpdatesEnabled(True)
 
     # retranslateUi
+
+    def retranslateHelpMenu(self):
+        self._applyTexts(self._helpTextSetters)
+
+    # retranslateHelpMenu
+
+    def _bindTextSetters(self, table):
+        return tuple(
+            (text, tuple(getattr(getattr(self, name), setter) for name in names))
+            for setter, text, names in table
+        )
+
+    def clearTranslations(self):
+        self._translations = None
+
+    def _getTranslations(self):
+        if self._translations is None:
+            translate = _get_translate()
+            self._translations = {
+                text: translate(_CONTEXT, text, None) for text in _SOURCE_TEXTS
+            }
+        return self._translations
+
+    def _applyTexts(self, textSetters):
+        translations = self._getTranslations()
+        for text, setters in textSetters:
+            text = translations[text]
+            for setter in setters:
+                setter(text)
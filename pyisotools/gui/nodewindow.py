@@ -11,11 +11,11 @@
 ################################################################################
 
 from typing import Optional
-from PySide6.QtCore import QCoreApplication, QMetaObject, QRect, QRegularExpression, Qt
-from PySide6.QtGui import QRegularExpressionValidator, QIntValidator
+from PySide6.QtCore import QRect, Qt, Slot
+from PySide6.QtGui import QRegularExpressionValidator
 from PySide6.QtWidgets import QLabel, QWidget, QDialog, QDialogButtonBox, QComboBox, QMessageBox, QSizePolicy
 
-from pyisotools.gui.customwidgets import FilteredPlainTextEdit, DialogLineEdit
+from pyisotools.gui.customwidgets import DialogLineEdit
 
 
 class NodeFieldAlignmentDialog(QDialog):
@@ -84,6 +84,10 @@ class NodeFieldPositionDialog(QDialog):
         font.setItalic(True)
         self.rangeLabel.setFont(font)
         self.rangeLabel.setGeometry(QRect(78, 22, 140, 36))
+
+        self.set_range(minimum, maximum)
+
+    def set_range(self, minimum: int, maximum: int):
         self.rangeLabel.setText(
             f"Min: 0x{minimum:X} - Max: 0x{maximum:X}"
         )
@@ -91,6 +95,7 @@ class NodeFieldPositionDialog(QDialog):
         self._minimum = minimum
         self._maximum = maximum
 
+    @Slot()
     def sanitize(self):
         if self.lineEdit.text().strip() == "":
             return
@@ -12,7 +12,7 @@
 
 from PySide6.QtCore import QCoreApplication, QMetaObject, QRect, QSize, Qt
 from PySide6.QtGui import QIcon
-from PySide6.QtWidgets import *
+from PySide6.QtWidgets import QCheckBox, QDialogButtonBox
 
 
 class Ui_Dialog():
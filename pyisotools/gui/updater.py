@@ -1,4 +1,3 @@
-import time
 import webbrowser
 from distutils.version import LooseVersion
 from logging import StreamHandler
@@ -18,7 +17,6 @@ class ReleaseManager:
         self._owner = owner
         self._repo = repository
         self._releases: List[GitRelease] = list()
-        self.populate()
 
     @property
     def owner(self):
@@ -77,14 +75,23 @@ class ReleaseManager:
         return markdown.rstrip(seperator).strip()
 
     def populate(self) -> bool:
+        """
+        Fetch the release list from GitHub
+
+        This blocks on the network, so it should only be called from a worker
+        thread. The releases are fully materialized here so that reading them
+        afterwards never touches the network
+        """
         g = Github()
         try:
             repo = g.get_repo(f"{self.owner}/{self.repository}")
-            self._releases = repo.get_releases()
-            return True
+            self._releases = list(repo.get_releases())
+            return len(self._releases) > 0
         except RateLimitExceededException:
             print("Rate limit exceeded, waiting 2 hours...")
             return False
+        except OSError:
+            return False
 
     def view(
         self,
@@ -119,9 +126,7 @@ class GitUpdateScraper(FlagThread):
             ) > LooseVersion(__version__.lstrip("v")):
                 self.updateFound.emit()
 
-            start = time.time()
-            while time.time() - start < self.waitTime and not self.isQuitting():
-                time.sleep(1)
+            self.waitForQuit(self.waitTime)
 
     def kill(self):
         self.quit()
@@ -142,5 +147,6 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     updater = GitUpdateScraper(args.owner, args.repository)
-    release = updater.get_newest_release()
+    updater.manager.populate()
+    release = updater.manager.get_newest_release()
     print(release)
@@ -1,6 +1,6 @@
 from pathlib import Path
 from typing import Optional
-from PySide6.QtCore import QThread, QObject, Signal, Slot
+from PySide6.QtCore import QObject, Signal
 from pyisotools.iso import GamecubeISO
 
 
@@ -1,21 +1,27 @@
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
-def resource_path(relPath: str = "") -> Path:
-    """ Get absolute path to resource, works for dev and for cx_freeze """
+def _get_resource_base() -> Path:
     if hasattr(sys, "_MEIPASS"):
-        return getattr(sys, "_MEIPASS", Path(__file__).parent) / relPath
-    else:
-        if getattr(sys, "frozen", False):
-            # The application is frozen
-            base_path = Path(sys.executable).parent
-        else:
-            base_path = Path(__file__).parent
+        return Path(getattr(sys, "_MEIPASS"))
+    if getattr(sys, "frozen", False):
+        # The application is frozen
+        return Path(sys.executable).parent
+    return Path(__file__).parent
+
 
-        return base_path / relPath
+_RESOURCE_BASE = _get_resource_base()
+
+
+@lru_cache(maxsize=None)
+def resource_path(relPath: str = "") -> Path:
+    """ Get absolute path to resource, works for dev and for cx_freeze """
+    return _RESOURCE_BASE / relPath
 
 
+@lru_cache(maxsize=None)
 def get_program_folder(folder: str = "") -> Path:
     """ Get path to appdata """
     from os import getenv
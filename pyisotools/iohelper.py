@@ -1,3 +1,4 @@
+import os
 import struct
 from typing import BinaryIO, Optional
 
@@ -124,5 +125,43 @@ def detect_encoding(string: bytes) -> str:
         return ""
 
 
+def copy_bytes(src: BinaryIO, dst: BinaryIO, size: int, bufsize: int = 0x100000):
+    """
+    Copies `size` bytes from the current position of `src` to the current position of `dst`,
+    advancing both. Real files are copied in kernel space where os.copy_file_range is available
+    """
+    if hasattr(os, "copy_file_range") and size > 0:
+        try:
+            srcfd = src.fileno()
+            dstfd = dst.fileno()
+        except OSError:
+            pass
+        else:
+            dst.flush()
+            srcpos = src.tell()
+            dstpos = dst.tell()
+            copied = 0
+            try:
+                while copied < size:
+                    length = os.copy_file_range(
+                        srcfd, dstfd, size - copied, srcpos + copied, dstpos + copied)
+                    if length == 0:
+                        break
+                    copied += length
+            except OSError:
+                # Unsupported by this file system, copy the rest normally
+                pass
+            src.seek(srcpos + copied)
+            dst.seek(dstpos + copied)
+            size -= copied
+
+    while size > 0:
+        chunk = src.read(min(size, bufsize))
+        if not chunk:
+            break
+        dst.write(chunk)
+        size -= len(chunk)
+
+
 def align_int(num: int, alignment: int) -> int:
     return (num + (alignment - 1)) & -alignment
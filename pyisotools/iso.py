@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import os
+import sys
 from fnmatch import fnmatch
 from io import BytesIO
 from pathlib import Path
@@ -14,7 +16,7 @@ from pyisotools.bi2 import BI2
 from pyisotools.bnrparser import BNR
 from pyisotools.boot import Boot
 from pyisotools.fst import FST, FSTNode, InvalidEntryError, InvalidFSTError
-from pyisotools.iohelper import (align_int, read_string, read_ubyte,
+from pyisotools.iohelper import (align_int, copy_bytes, read_string, read_ubyte,
                                  read_uint32, write_uint32)
 
 
@@ -26,6 +28,13 @@ class FileSystemInvalidError(Exception):
     ...
 
 
+def _get_folder_names(path: Path) -> set:
+    # DirEntry.is_dir() is answered by the directory listing itself on
+    # most platforms, so this avoids a stat() per entry
+    with os.scandir(path) as entries:
+        return {entry.name.lower() for entry in entries if entry.is_dir()}
+
+
 class _ISOInfo(FST):
 
     def __init__(self):
@@ -161,7 +170,8 @@ class ISOBase(_ISOInfo):
         _size = read_uint32(fst)
 
         _oldpos = fst.tell()
-        node.name = read_string(fst, strTabOfs + _nameOfs)
+        # names repeat heavily across folders, so share one string per name
+        node.name = sys.intern(read_string(fst, strTabOfs + _nameOfs))
         fst.seek(_oldpos)
 
         node._id = self._curEntry
@@ -199,16 +209,18 @@ class ISOBase(_ISOInfo):
             self._locationTable = SortedDict(data["location"])
             self._excludeTable = SortedList(data["exclude"])
 
-    def _recursive_extract(self, node: FSTNode, dest: Path, iso: BinaryIO, dumpPositions: bool = False):
+    def _recursive_extract(self, node: FSTNode, dest: Union[Path, str], iso: BinaryIO, dumpPositions: bool = False):
+        # Destinations are joined as plain strings, one Path per node adds up on large discs
         if node.is_file():
             self.onPhysicalTaskStart(node.path, node.size)
             iso.seek(node._fileoffset)
-            dest.write_bytes(iso.read(node.size))
+            with open(dest, "wb") as f:
+                copy_bytes(iso, f, node.size)
             self.onPhysicalTaskComplete()
         else:
-            dest.mkdir(parents=True, exist_ok=True)
+            os.makedirs(dest, exist_ok=True)
             for child in node.children:
-                self._recursive_extract(child, dest/child.name, iso)
+                self._recursive_extract(child, os.path.join(dest, child.name), iso)
 
         if dumpPositions:
             self._locationTable[node.path] = node._fileoffset
@@ -243,6 +255,11 @@ class ISOBase(_ISOInfo):
         if self._alignmentTable is None:
             return alignment
 
+        # Saved configs key most entries by exact node path, so try that before the globs
+        width = self._alignmentTable.get(_path)
+        if width is not None:
+            return max(min(width, 32768), 4)
+
         for entry, width in self._alignmentTable.items():
             if fnmatch(_path, entry.strip()):
                 alignment = max(min(width, 32768), 4)
@@ -267,6 +284,8 @@ class ISOBase(_ISOInfo):
             _path = node
 
         if self._excludeTable:
+            if _path in self._excludeTable:
+                return True
             for entry in self._excludeTable:
                 if fnmatch(_path, entry.strip()):
                     return True
@@ -332,16 +351,13 @@ class GamecubeISO(ISOBase):
 
     def is_dolphin_root(self) -> bool:
         if self.root:
-            folders = {x.name.lower()
-                       for x in self.root.iterdir() if x.is_dir()}
+            folders = _get_folder_names(self.root)
             return "sys" in folders and "files" in folders and "&&systemdata" not in folders
         return False
 
     def is_gcr_root(self) -> bool:
         if self.root:
-            folders = {x.name.lower()
-                       for x in self.root.iterdir() if x.is_dir()}
-            return "&&systemdata" in folders
+            return "&&systemdata" in _get_folder_names(self.root)
         return False
 
     def build(self, dest: Union[Path, str] = None, preCalc: bool = True):
@@ -358,7 +374,7 @@ class GamecubeISO(ISOBase):
 
         # --- FST --- #
 
-        fstsize = sum([len(n.name) + 13 for n in self.rchildren()])
+        fstsize = sum(len(n.name) + 13 for n in self.rchildren())
         self.onVirtualJobStart("FST Generation", fstsize)
 
         if preCalc:
@@ -372,16 +388,34 @@ class GamecubeISO(ISOBase):
         _curEntry = 1
         _strOfs = 0
         _strTableOfs = self.strTableOfs
+
+        # A folder's end index is only known once its subtree has been
+        # written, so it is filled in as the walk leaves the folder rather
+        # than counting every subtree up front
+        _openDirs = []
+
+        def close_dirs(parent: Optional[FSTNode]):
+            while _openDirs and _openDirs[-1][0] is not parent:
+                _, _endOfs = _openDirs.pop()
+                _oldpos = self._rawFST.tell()
+                self._rawFST.seek(_endOfs)
+                write_uint32(self._rawFST, _curEntry)
+                self._rawFST.seek(_oldpos)
+
         for child in self.rchildren(includedOnly=True):
+            close_dirs(child.parent)
             self.onVirtualTaskStart(child.path, len(child.name) + 13)
 
             child._id = _curEntry
             self._rawFST.write(b"\x01" if child.is_dir() else b"\x00")
             self._rawFST.write((_strOfs).to_bytes(3, "big", signed=False))
-            write_uint32(
-                self._rawFST, child.parent._id if child.is_dir() else child._fileoffset)
-            write_uint32(self._rawFST, len(child) +
-                         _curEntry if child.is_dir() else child.size)
+            if child.is_dir():
+                write_uint32(self._rawFST, child.parent._id)
+                _openDirs.append((child, self._rawFST.tell()))
+                write_uint32(self._rawFST, 0)
+            else:
+                write_uint32(self._rawFST, child._fileoffset)
+                write_uint32(self._rawFST, child.size)
             _curEntry += 1
 
             _oldpos = self._rawFST.tell()
@@ -392,6 +426,8 @@ class GamecubeISO(ISOBase):
 
             self.onVirtualTaskComplete()
 
+        close_dirs(None)
+
         self.bootheader.fstSize = len(self._rawFST.getbuffer())
         self.bootheader.fstMaxSize = self.bootheader.fstSize
 
@@ -468,11 +504,13 @@ class GamecubeISO(ISOBase):
             f.write(self._rawFST.getvalue())
             self.onVirtualTaskComplete()
 
+            dataPath = str(self.dataPath)
             for child in self.rfiles(includedOnly=True):
                 self.onVirtualTaskStart(child.path, child.size)
                 f.write(b"\x00" * (child._fileoffset - f.tell()))
                 f.seek(child._fileoffset)
-                f.write((self.dataPath / child.path).read_bytes())
+                with open(os.path.join(dataPath, child.path), "rb") as data:
+                    copy_bytes(data, f, child.size)
                 f.seek(0, 2)
                 self.onVirtualTaskComplete()
 
@@ -686,26 +724,26 @@ class GamecubeISO(ISOBase):
             _rawISO.seek(self.bootheader.fstOffset)
             self._rawFST = BytesIO(_rawISO.read(self.bootheader.fstSize))
 
-        self.load_file_systemv(self._rawFST)
+            self.load_file_systemv(self._rawFST)
 
-        if self.bootinfo.countryCode == BI2.Country.JAPAN:
-            region = BNR.Regions.JAPAN
-        else:
-            region = self.bootinfo.countryCode - 1
+            if self.bootinfo.countryCode == BI2.Country.JAPAN:
+                region = BNR.Regions.JAPAN
+            else:
+                region = self.bootinfo.countryCode - 1
 
-        bnrNode = None
-        for child in self.children:
-            if child.is_file() and fnmatch(child.path, "*opening.bnr"):
-                bnrNode = child
-                break
+            bnrNode = None
+            for child in self.children:
+                if child.name.lower().endswith("opening.bnr") and child.is_file():
+                    bnrNode = child
+                    break
 
-        if bnrNode:
-            with iso.open("rb") as _rawISO:
+            # Read the banner while the image is still open rather than reopening it
+            if bnrNode:
                 _rawISO.seek(bnrNode._fileoffset)
                 self.bnr = BNR.from_data(
                     _rawISO, region=region, size=bnrNode.size)
-        else:
-            self.bnr = None
+            else:
+                self.bnr = None
 
         prev = FSTNode.file("", None, self.bootheader.fstSize,
                             self.bootheader.fstOffset)
@@ -766,7 +804,7 @@ class GamecubeISO(ISOBase):
             region = self.bootinfo.countryCode - 1
 
         for f in self.dataPath.iterdir():
-            if f.is_file() and f.match("*opening.bnr"):
+            if f.name.lower().endswith("opening.bnr") and f.is_file():
                 if self._get_excluded(f.name):
                     continue
                 self.bnr = BNR(f, region=region)
@@ -916,15 +954,23 @@ class GamecubeISO(ISOBase):
         with self.configPath.open("w") as f:
             json.dump(config, f, indent=4)
 
-    def _load_from_path(self, path: Path, parentnode: FSTNode = None, ignoreList: tuple = ()):
-        for entry in sorted(path.iterdir(), key=lambda x: x.name.upper()):
-            if self.is_gcr_root() and entry.name.lower() == "&&systemdata":
+    def _load_from_path(self, path: Union[Path, str], parentnode: FSTNode = None, ignoreList: tuple = (), isGCR: bool = None):
+        if isGCR is None:
+            isGCR = self.is_gcr_root()
+
+        # DirEntry caches the type (and on Windows the stat) from the listing
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda x: x.name.upper())
+
+        for entry in entries:
+            if isGCR and entry.name.lower() == "&&systemdata":
                 continue
 
             disable = False
-            for badPath in ignoreList:
-                if entry.match(badPath):
-                    disable = True
+            if ignoreList:
+                entryPath = Path(entry.path)
+                disable = any(entryPath.match(badPath)
+                              for badPath in ignoreList)
 
             if entry.is_file():
                 child = FSTNode.file(
@@ -932,7 +978,6 @@ class GamecubeISO(ISOBase):
                 child._alignment = self._get_alignment(child)
                 child._position = self._get_location(child)
                 child._exclude = disable
-                child.size = entry.stat().st_size
 
             elif entry.is_dir():
                 child = FSTNode.folder(entry.name)
@@ -940,7 +985,8 @@ class GamecubeISO(ISOBase):
                 if parentnode is not None:
                     parentnode.add_child(child)
 
-                self._load_from_path(entry, child, ignoreList=ignoreList)
+                self._load_from_path(
+                    entry.path, child, ignoreList=ignoreList, isGCR=isGCR)
             else:
                 raise InvalidEntryError("Not a dir or file")
 
@@ -19,6 +19,7 @@ setuptools.setup(
     license="GNU General Public License v3.0",
     packages=setuptools.find_packages(),
     include_package_data=True,
+    package_data={"pyisotools.gui": ["icons.rcc"]},
     install_requires=requires,
     classifiers=[
         "Development Status :: 4 - Beta",